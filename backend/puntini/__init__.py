@@ -19,120 +19,222 @@ Example:
     >>> result = agent.invoke(state)
 """
 
-# Core agent functionality
-from .agents.agent_factory import (
-    create_simple_agent,
-    create_agent_with_components,
-    create_initial_state,
-    AgentConfig,
-)
-
-# Graph store implementations
-from .graph.graph_store_factory import (
-    create_memory_graph_store,
-    GraphStoreConfig,
-)
-
-# Context management
-from .context.context_manager_factory import (
-    create_simple_context_manager,
-    ContextManagerConfig,
-)
-
-# Tool registry
-from .tools.tool_registry_factory import (
-    create_standard_tool_registry,
-    ToolRegistryConfig,
-)
-from .tools.tool_setup import (
-    create_tool_registry_with_validation,
-    create_configured_tool_registry,
-    validate_tool_registry,
-)
-
-# Observability and tracing
-from .observability.tracer_factory import (
-    create_langfuse_tracer,
-    create_noop_tracer,
-    create_console_tracer,
-    TracerConfig,
-)
-
-# Graph orchestration
-from .orchestration.graph import (
-    create_agent_graph,
-    create_agent_with_checkpointer,
-)
-
-# Interfaces
-from .interfaces import (
-    GraphStore,
-    ContextManager,
-    ToolRegistry,
-    Tracer,
-    Planner,
-    Executor,
-    Evaluator,
-    ErrorClassifier,
-    EscalationHandler,
-    ModelInput,
-    ToolCallable,
-)
-
-# Settings and configuration
-from .utils.settings import (
-    Settings,
-    LLMConfig,
-    LLMProviderConfig,
-    LoggingConfig,
-    AgentConfig as SettingsAgentConfig,
-)
-
-# Core data models
-from .models.base import BaseEntity
-from .models.node import Node
-from .models.edge import Edge
-from .models.specs import NodeSpec, EdgeSpec, MatchSpec, ToolSpec
-from .models.errors import (
-    AgentError,
-    ValidationError,
-    ConstraintViolationError,
-    NotFoundError,
-    ToolError,
-)
-
-# Logging utilities
-from .logging import (
-    get_logger,
-    setup_logging,
-    get_logging_service,
-)
-
-# LLM factory
-from .llm.llm_models import LLMFactory
-
-# API module
-from .api import (
-    create_app,
-    AuthManager,
-    get_current_user,
-    SessionManager,
-    WebSocketManager,
-    Message,
-    MessageType,
-    UserPrompt,
-    AssistantResponse,
-    Reasoning,
-    Debug,
-    GraphUpdate,
-    Error,
-    SessionReady,
-    InitSession,
-    CloseSession,
-    ChatHistory,
-    Ping,
-    Pong,
-)
+import typing as _typing
+from importlib import import_module as _import_module
+
+# Public names are resolved lazily (PEP 562) so that importing a single
+# submodule, e.g. ``puntini.models.goal_schemas``, does not pull in the
+# LangGraph agent, the API server and their dependencies.
+_LAZY_IMPORTS = {
+    # Core agent functionality
+    "create_simple_agent": (".agents.agent_factory", "create_simple_agent"),
+    "create_agent_with_components": (".agents.agent_factory", "create_agent_with_components"),
+    "create_initial_state": (".agents.agent_factory", "create_initial_state"),
+    "AgentConfig": (".agents.agent_factory", "AgentConfig"),
+    # Graph store implementations
+    "create_memory_graph_store": (".graph.graph_store_factory", "create_memory_graph_store"),
+    "GraphStoreConfig": (".graph.graph_store_factory", "GraphStoreConfig"),
+    # Context management
+    "create_simple_context_manager": (".context.context_manager_factory", "create_simple_context_manager"),
+    "ContextManagerConfig": (".context.context_manager_factory", "ContextManagerConfig"),
+    # Tool registry
+    "create_standard_tool_registry": (".tools.tool_registry_factory", "create_standard_tool_registry"),
+    "ToolRegistryConfig": (".tools.tool_registry_factory", "ToolRegistryConfig"),
+    "create_tool_registry_with_validation": (".tools.tool_setup", "create_tool_registry_with_validation"),
+    "create_configured_tool_registry": (".tools.tool_setup", "create_configured_tool_registry"),
+    "validate_tool_registry": (".tools.tool_setup", "validate_tool_registry"),
+    # Observability and tracing
+    "create_langfuse_tracer": (".observability.tracer_factory", "create_langfuse_tracer"),
+    "create_noop_tracer": (".observability.tracer_factory", "create_noop_tracer"),
+    "create_console_tracer": (".observability.tracer_factory", "create_console_tracer"),
+    "TracerConfig": (".observability.tracer_factory", "TracerConfig"),
+    # Graph orchestration
+    "create_agent_graph": (".orchestration.graph", "create_agent_graph"),
+    "create_agent_with_checkpointer": (".orchestration.graph", "create_agent_with_checkpointer"),
+    # Interfaces
+    "GraphStore": (".interfaces", "GraphStore"),
+    "ContextManager": (".interfaces", "ContextManager"),
+    "ToolRegistry": (".interfaces", "ToolRegistry"),
+    "Tracer": (".interfaces", "Tracer"),
+    "Planner": (".interfaces", "Planner"),
+    "Executor": (".interfaces", "Executor"),
+    "Evaluator": (".interfaces", "Evaluator"),
+    "ErrorClassifier": (".interfaces", "ErrorClassifier"),
+    "EscalationHandler": (".interfaces", "EscalationHandler"),
+    "ModelInput": (".interfaces", "ModelInput"),
+    "ToolCallable": (".interfaces", "ToolCallable"),
+    # Settings and configuration
+    "Settings": (".utils.settings", "Settings"),
+    "LLMConfig": (".utils.settings", "LLMConfig"),
+    "LLMProviderConfig": (".utils.settings", "LLMProviderConfig"),
+    "LoggingConfig": (".utils.settings", "LoggingConfig"),
+    "SettingsAgentConfig": (".utils.settings", "AgentConfig"),
+    # Core data models
+    "BaseEntity": (".models.base", "BaseEntity"),
+    "Node": (".models.node", "Node"),
+    "Edge": (".models.edge", "Edge"),
+    "NodeSpec": (".models.specs", "NodeSpec"),
+    "EdgeSpec": (".models.specs", "EdgeSpec"),
+    "MatchSpec": (".models.specs", "MatchSpec"),
+    "ToolSpec": (".models.specs", "ToolSpec"),
+    "AgentError": (".models.errors", "AgentError"),
+    "ValidationError": (".models.errors", "ValidationError"),
+    "ConstraintViolationError": (".models.errors", "ConstraintViolationError"),
+    "NotFoundError": (".models.errors", "NotFoundError"),
+    "ToolError": (".models.errors", "ToolError"),
+    # Logging utilities
+    "get_logger": (".logging", "get_logger"),
+    "setup_logging": (".logging", "setup_logging"),
+    "get_logging_service": (".logging", "get_logging_service"),
+    # LLM factory
+    "LLMFactory": (".llm.llm_models", "LLMFactory"),
+    # API module
+    "create_app": (".api", "create_app"),
+    "AuthManager": (".api", "AuthManager"),
+    "get_current_user": (".api", "get_current_user"),
+    "SessionManager": (".api", "SessionManager"),
+    "WebSocketManager": (".api", "WebSocketManager"),
+    "Message": (".api", "Message"),
+    "MessageType": (".api", "MessageType"),
+    "UserPrompt": (".api", "UserPrompt"),
+    "AssistantResponse": (".api", "AssistantResponse"),
+    "Reasoning": (".api", "Reasoning"),
+    "Debug": (".api", "Debug"),
+    "GraphUpdate": (".api", "GraphUpdate"),
+    "Error": (".api", "Error"),
+    "SessionReady": (".api", "SessionReady"),
+    "InitSession": (".api", "InitSession"),
+    "CloseSession": (".api", "CloseSession"),
+    "ChatHistory": (".api", "ChatHistory"),
+    "Ping": (".api", "Ping"),
+    "Pong": (".api", "Pong"),
+}
+
+# Static type checkers and IDEs see the real objects behind the lazy names.
+if _typing.TYPE_CHECKING:
+    from .agents.agent_factory import (
+        create_simple_agent,
+        create_agent_with_components,
+        create_initial_state,
+        AgentConfig,
+    )
+    from .graph.graph_store_factory import (
+        create_memory_graph_store,
+        GraphStoreConfig,
+    )
+    from .context.context_manager_factory import (
+        create_simple_context_manager,
+        ContextManagerConfig,
+    )
+    from .tools.tool_registry_factory import (
+        create_standard_tool_registry,
+        ToolRegistryConfig,
+    )
+    from .tools.tool_setup import (
+        create_tool_registry_with_validation,
+        create_configured_tool_registry,
+        validate_tool_registry,
+    )
+    from .observability.tracer_factory import (
+        create_langfuse_tracer,
+        create_noop_tracer,
+        create_console_tracer,
+        TracerConfig,
+    )
+    from .orchestration.graph import (
+        create_agent_graph,
+        create_agent_with_checkpointer,
+    )
+    from .interfaces import (
+        GraphStore,
+        ContextManager,
+        ToolRegistry,
+        Tracer,
+        Planner,
+        Executor,
+        Evaluator,
+        ErrorClassifier,
+        EscalationHandler,
+        ModelInput,
+        ToolCallable,
+    )
+    from .utils.settings import (
+        Settings,
+        LLMConfig,
+        LLMProviderConfig,
+        LoggingConfig,
+        AgentConfig as SettingsAgentConfig,
+    )
+    from .models.base import BaseEntity
+    from .models.node import Node
+    from .models.edge import Edge
+    from .models.specs import (
+        NodeSpec,
+        EdgeSpec,
+        MatchSpec,
+        ToolSpec,
+    )
+    from .models.errors import (
+        AgentError,
+        ValidationError,
+        ConstraintViolationError,
+        NotFoundError,
+        ToolError,
+    )
+    from .logging import (
+        get_logger,
+        setup_logging,
+        get_logging_service,
+    )
+    from .llm.llm_models import LLMFactory
+    from .api import (
+        create_app,
+        AuthManager,
+        get_current_user,
+        SessionManager,
+        WebSocketManager,
+        Message,
+        MessageType,
+        UserPrompt,
+        AssistantResponse,
+        Reasoning,
+        Debug,
+        GraphUpdate,
+        Error,
+        SessionReady,
+        InitSession,
+        CloseSession,
+        ChatHistory,
+        Ping,
+        Pong,
+    )
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """Import a public attribute from its submodule on first access.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The requested attribute, cached in the package namespace.
+
+    Raises:
+        AttributeError: If the name is not part of the public API.
+    """
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _typing.List[str]:
+    """List the module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Package metadata
 __version__ = "0.1.0"
@@ -9,7 +9,7 @@ import os
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.websockets import WebSocketDisconnect
@@ -275,12 +275,15 @@ def create_app(settings: Settings = None) -> FastAPI:
             
             graph_logger.info(f"Returning graph data: {len(nodes)} nodes, {len(edges)} edges")
             
-            return GraphDataResponse(
+            # The payload is validated on construction; returning a Response directly
+            # skips FastAPI's second validation pass against response_model.
+            graph_data = GraphDataResponse(
                 nodes=node_responses,
                 edges=edge_responses,
                 total_nodes=len(nodes),
                 total_edges=len(edges)
             )
+            return Response(content=graph_data.model_dump_json(), media_type="application/json")
             
         except HTTPException:
             raise
@@ -356,12 +359,13 @@ def create_app(settings: Settings = None) -> FastAPI:
             
             graph_logger.info(f"Returning subgraph: {len(node_responses)} nodes, {len(edge_responses)} edges")
             
-            return SubgraphResponse(
+            subgraph = SubgraphResponse(
                 nodes=node_responses,
                 edges=edge_responses,
                 depth=subgraph_data['depth'],
                 central_nodes=subgraph_data['central_nodes']
             )
+            return Response(content=subgraph.model_dump_json(), media_type="application/json")
             
         except HTTPException:
             raise
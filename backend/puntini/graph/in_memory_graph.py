@@ -4,7 +4,8 @@ This module implements the core graph operations tools that
 the agent can use to manipulate the graph database.
 """
 
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from ..interfaces.graph_store import GraphStore
@@ -13,6 +14,13 @@ from ..models.node import Node
 from ..models.specs import EdgeSpec, MatchSpec, NodeSpec
 from ..models.errors import ValidationError, NotFoundError
 
+# (node ids, edge ids) reached at each BFS step of a subgraph traversal.
+_SubgraphLayers = List[Tuple[List[UUID], List[UUID]]]
+# Central node ids and direction of a cached traversal.
+_SubgraphCacheKey = Tuple[Tuple[UUID, ...], str]
+# Layers plus the node and edge ids reached so far.
+_SubgraphCacheEntry = Tuple[_SubgraphLayers, Set[UUID], Set[UUID]]
+
 
 class InMemoryGraphStore:
     """In-memory implementation of GraphStore for testing.
@@ -22,12 +30,45 @@ class InMemoryGraphStore:
     Implements the GraphStore protocol with idempotent semantics.
     """
     
+    # Upper bound on cached subgraph traversals; least recently used
+    # entries are evicted.
+    _SUBGRAPH_CACHE_MAXSIZE = 128
+    
     def __init__(self):
         """Initialize the in-memory graph store."""
         self._nodes: Dict[str, Node] = {}
         self._edges: Dict[str, Edge] = {}
         self._node_key_to_id: Dict[str, UUID] = {}
         self._edge_key_to_id: Dict[str, UUID] = {}
+        # Secondary indexes from label / key to node ids. Dicts are used as
+        # insertion-ordered sets so lookups return nodes in creation order.
+        self._label_index: Dict[str, Dict[str, None]] = {}
+        self._key_index: Dict[str, Dict[str, None]] = {}
+        # Edge indexes from relationship type / endpoint key to edge ids.
+        self._edge_type_index: Dict[str, Dict[str, None]] = {}
+        self._edge_key_index: Dict[str, Dict[str, None]] = {}
+        # Adjacency from node id to the ids of its outgoing / incoming edges.
+        self._out_edges: Dict[UUID, Dict[str, None]] = {}
+        self._in_edges: Dict[UUID, Dict[str, None]] = {}
+        # Bumped on every mutation; derived caches are only valid for the
+        # version they were built against.
+        self._version = 0
+        # BFS layers per (central node ids, direction), extended on demand so
+        # that repeated get_subgraph calls at growing depths share one walk.
+        self._subgraph_cache: "OrderedDict[_SubgraphCacheKey, _SubgraphCacheEntry]" = OrderedDict()
+    
+    @property
+    def version(self) -> int:
+        """Mutation counter, bumped whenever nodes or edges change.
+        
+        Callers can key caches on it to detect a changed graph.
+        """
+        return self._version
+    
+    def _touch(self) -> None:
+        """Record a mutation and drop caches derived from the old graph."""
+        self._version += 1
+        self._subgraph_cache.clear()
     
     def upsert_node(self, spec: NodeSpec) -> Node:
         """Create or update a node using a natural key and idempotent semantics.
@@ -41,9 +82,34 @@ class InMemoryGraphStore:
         Raises:
             ValidationError: If the input spec is not valid.
         """
+        self._check_node_spec(spec)
+        node = self._write_node(spec)
+        self._touch()
+        return node
+    
+    def _check_node_spec(self, spec: NodeSpec) -> None:
+        """Validate a node specification.
+        
+        Args:
+            spec: Node specification to check.
+            
+        Raises:
+            ValidationError: If the label or key is missing.
+        """
         if not spec.label or not spec.key:
             raise ValidationError("Node label and key are required")
+    
+    def _write_node(self, spec: NodeSpec) -> Node:
+        """Create or update a node from an already validated specification.
+        
+        The caller is responsible for calling ``_touch`` afterwards.
         
+        Args:
+            spec: Validated node specification.
+            
+        Returns:
+            The persisted Node.
+        """
         # Check if node already exists
         node_key = f"{spec.label}:{spec.key}"
         if node_key in self._node_key_to_id:
@@ -62,8 +128,11 @@ class InMemoryGraphStore:
             key=spec.key,
             properties=spec.properties
         )
-        self._nodes[str(node.id)] = node
+        stored_id = str(node.id)
+        self._nodes[stored_id] = node
         self._node_key_to_id[node_key] = node.id
+        self._label_index.setdefault(spec.label, {})[stored_id] = None
+        self._key_index.setdefault(spec.key, {})[stored_id] = None
         return node
     
     def upsert_edge(self, spec: EdgeSpec) -> Edge:
@@ -78,6 +147,23 @@ class InMemoryGraphStore:
         Raises:
             ValidationError: If the input spec is not valid.
         """
+        edge = self._write_edge(spec, self._resolve_edge_endpoints(spec))
+        self._touch()
+        return edge
+    
+    def _resolve_edge_endpoints(self, spec: EdgeSpec) -> Tuple[str, UUID, UUID]:
+        """Validate an edge specification and look up its endpoints.
+        
+        Args:
+            spec: Edge specification to resolve.
+            
+        Returns:
+            The edge's natural key and the ids of its source and target nodes.
+            
+        Raises:
+            ValidationError: If the relationship type or an endpoint key is missing.
+            NotFoundError: If the source or target node does not exist.
+        """
         if not spec.relationship_type or not spec.source_key or not spec.target_key:
             raise ValidationError("Edge relationship type, source key, and target key are required")
         
@@ -90,11 +176,24 @@ class InMemoryGraphStore:
         if target_key not in self._node_key_to_id:
             raise NotFoundError(f"Target node not found: {target_key}")
         
-        source_id = self._node_key_to_id[source_key]
-        target_id = self._node_key_to_id[target_key]
+        edge_key = f"{source_key}-[{spec.relationship_type}]->{target_key}"
+        return edge_key, self._node_key_to_id[source_key], self._node_key_to_id[target_key]
+    
+    def _write_edge(self, spec: EdgeSpec, endpoints: Tuple[str, UUID, UUID]) -> Edge:
+        """Create or update an edge from a resolved specification.
+        
+        The caller is responsible for calling ``_touch`` afterwards.
+        
+        Args:
+            spec: Validated edge specification.
+            endpoints: Result of ``_resolve_edge_endpoints`` for the spec.
+            
+        Returns:
+            The persisted Edge.
+        """
+        edge_key, source_id, target_id = endpoints
         
         # Check if edge already exists
-        edge_key = f"{source_key}-[{spec.relationship_type}]->{target_key}"
         if edge_key in self._edge_key_to_id:
             edge_id = self._edge_key_to_id[edge_key]
             existing_edge = self._edges[str(edge_id)]
@@ -116,10 +215,64 @@ class InMemoryGraphStore:
             target_label=spec.target_label,
             properties=spec.properties
         )
-        self._edges[str(edge.id)] = edge
+        stored_id = str(edge.id)
+        self._edges[stored_id] = edge
         self._edge_key_to_id[edge_key] = edge.id
+        self._edge_type_index.setdefault(spec.relationship_type, {})[stored_id] = None
+        self._edge_key_index.setdefault(spec.source_key, {})[stored_id] = None
+        self._edge_key_index.setdefault(spec.target_key, {})[stored_id] = None
+        self._out_edges.setdefault(source_id, {})[stored_id] = None
+        self._in_edges.setdefault(target_id, {})[stored_id] = None
         return edge
     
+    def upsert_nodes_bulk(self, specs: List[NodeSpec]) -> List[Node]:
+        """Create or update several nodes in one call.
+
+        Every specification is validated before any node is written, so an
+        invalid entry leaves the store unchanged. The store version is bumped
+        once for the whole batch.
+
+        Args:
+            specs: Node specifications to upsert, in order.
+
+        Returns:
+            The persisted Nodes, in the order of the specifications.
+
+        Raises:
+            ValidationError: If any of the specs is not valid.
+        """
+        for spec in specs:
+            self._check_node_spec(spec)
+        
+        nodes = [self._write_node(spec) for spec in specs]
+        if nodes:
+            self._touch()
+        return nodes
+    
+    def upsert_edges_bulk(self, specs: List[EdgeSpec]) -> List[Edge]:
+        """Create or update several edges in one call.
+
+        Every specification and endpoint is checked before any edge is
+        written, so an invalid entry leaves the store unchanged. The store
+        version is bumped once for the whole batch.
+
+        Args:
+            specs: Edge specifications to upsert, in order.
+
+        Returns:
+            The persisted Edges, in the order of the specifications.
+
+        Raises:
+            ValidationError: If any of the specs is not valid.
+            NotFoundError: If a source or target node does not exist.
+        """
+        resolved = [(spec, self._resolve_edge_endpoints(spec)) for spec in specs]
+        
+        edges = [self._write_edge(spec, endpoints) for spec, endpoints in resolved]
+        if edges:
+            self._touch()
+        return edges
+    
     def update_props(self, target: MatchSpec, props: Dict[str, Any]) -> None:
         """Update properties of nodes or edges matching the given specification.
 
@@ -135,26 +288,25 @@ class InMemoryGraphStore:
         
         updated_count = 0
         
-        # Update nodes
-        for node_id, node in self._nodes.items():
-            if self._matches_node(node, target):
-                updated_node = node.model_copy(update={
-                    "properties": {**node.properties, **props}
-                })
-                self._nodes[node_id] = updated_node
-                updated_count += 1
-        
-        # Update edges
-        for edge_id, edge in self._edges.items():
-            if self._matches_edge(edge, target):
-                updated_edge = edge.model_copy(update={
-                    "properties": {**edge.properties, **props}
-                })
-                self._edges[edge_id] = updated_edge
-                updated_count += 1
+        # Update nodes, resolved through the label / key indexes
+        for node in self.match_nodes(target):
+            updated_node = node.model_copy(update={
+                "properties": {**node.properties, **props}
+            })
+            self._nodes[str(node.id)] = updated_node
+            updated_count += 1
+        
+        # Update edges, resolved through the type / key indexes
+        for edge in self.match_edges(target):
+            updated_edge = edge.model_copy(update={
+                "properties": {**edge.properties, **props}
+            })
+            self._edges[str(edge.id)] = updated_edge
+            updated_count += 1
         
         if updated_count == 0:
             raise NotFoundError(f"No matching nodes or edges found for specification: {target}")
+        self._touch()
     
     def delete_node(self, match: MatchSpec) -> None:
         """Delete nodes matching the given specification.
@@ -165,12 +317,7 @@ class InMemoryGraphStore:
         Raises:
             NotFoundError: If no matching nodes are found.
         """
-        nodes_to_delete = []
-        
-        # Find nodes to delete
-        for node_id, node in self._nodes.items():
-            if self._matches_node(node, match):
-                nodes_to_delete.append((node_id, node))
+        nodes_to_delete = [(str(node.id), node) for node in self.match_nodes(match)]
         
         if not nodes_to_delete:
             raise NotFoundError(f"No matching nodes found for specification: {match}")
@@ -178,24 +325,22 @@ class InMemoryGraphStore:
         # Delete nodes and their associated edges
         for node_id, node in nodes_to_delete:
             # Delete all edges connected to this node
-            edges_to_delete = []
-            for edge_id, edge in self._edges.items():
-                if edge.source_id == node.id or edge.target_id == node.id:
-                    edges_to_delete.append(edge_id)
-            
-            # Remove edges
+            edges_to_delete = {
+                **self._out_edges.get(node.id, {}),
+                **self._in_edges.get(node.id, {}),
+            }
             for edge_id in edges_to_delete:
-                edge = self._edges[edge_id]
-                edge_key = f"{edge.source_label}:{edge.source_key}-[{edge.relationship_type}]->{edge.target_label}:{edge.target_key}"
-                del self._edges[edge_id]
-                if edge_key in self._edge_key_to_id:
-                    del self._edge_key_to_id[edge_key]
+                self._remove_edge(edge_id, self._edges[edge_id])
             
             # Remove node
             node_key = f"{node.label}:{node.key}"
             del self._nodes[node_id]
             if node_key in self._node_key_to_id:
                 del self._node_key_to_id[node_key]
+            self._unindex(self._label_index, node.label, node_id)
+            self._unindex(self._key_index, node.key, node_id)
+        
+        self._touch()
     
     def delete_edge(self, match: MatchSpec) -> None:
         """Delete edges matching the given specification.
@@ -206,22 +351,33 @@ class InMemoryGraphStore:
         Raises:
             NotFoundError: If no matching edges are found.
         """
-        edges_to_delete = []
-        
-        # Find edges to delete
-        for edge_id, edge in self._edges.items():
-            if self._matches_edge(edge, match):
-                edges_to_delete.append((edge_id, edge))
+        edges_to_delete = [(str(edge.id), edge) for edge in self.match_edges(match)]
         
         if not edges_to_delete:
             raise NotFoundError(f"No matching edges found for specification: {match}")
         
         # Delete edges
         for edge_id, edge in edges_to_delete:
-            edge_key = f"{edge.source_label}:{edge.source_key}-[{edge.relationship_type}]->{edge.target_label}:{edge.target_key}"
-            del self._edges[edge_id]
-            if edge_key in self._edge_key_to_id:
-                del self._edge_key_to_id[edge_key]
+            self._remove_edge(edge_id, edge)
+        
+        self._touch()
+    
+    def _remove_edge(self, edge_id: str, edge: Edge) -> None:
+        """Remove an edge from the storage and all edge indexes.
+        
+        Args:
+            edge_id: Storage id of the edge.
+            edge: The edge to remove.
+        """
+        edge_key = f"{edge.source_label}:{edge.source_key}-[{edge.relationship_type}]->{edge.target_label}:{edge.target_key}"
+        del self._edges[edge_id]
+        if edge_key in self._edge_key_to_id:
+            del self._edge_key_to_id[edge_key]
+        self._unindex(self._edge_type_index, edge.relationship_type, edge_id)
+        self._unindex(self._edge_key_index, edge.source_key, edge_id)
+        self._unindex(self._edge_key_index, edge.target_key, edge_id)
+        self._unindex(self._out_edges, edge.source_id, edge_id)
+        self._unindex(self._in_edges, edge.target_id, edge_id)
     
     def run_cypher(self, query: str, params: Dict[str, Any] | None = None) -> Any:
         """Execute a raw Cypher query against the graph database.
@@ -351,56 +507,17 @@ class InMemoryGraphStore:
             raise ValidationError("Direction must be 'incoming', 'outgoing', or 'all'")
         
         # Find central nodes
-        central_nodes = []
-        for node in self._nodes.values():
-            if self._matches_node(node, match):
-                central_nodes.append(node)
+        central_nodes = self.match_nodes(match)
         
         if not central_nodes:
             raise NotFoundError(f"No matching nodes found for specification: {match}")
         
         # Collect nodes and edges within depth
-        subgraph_nodes = set(node.id for node in central_nodes)
+        subgraph_nodes = set()
         subgraph_edges = set()
-        
-        # Start with central nodes
-        current_level = central_nodes
-        
-        # Expand by depth
-        for _ in range(depth):
-            next_level = []
-            
-            for node in current_level:
-                # Find all edges connected to this node
-                for edge in self._edges.values():
-                    # Outgoing edge
-                    if direction in ["outgoing", "all"] and edge.source_id == node.id:
-                        if edge.id not in subgraph_edges:
-                            subgraph_edges.add(edge.id)
-                            
-                            # Add connected nodes
-                            connected_node_id = edge.target_id
-                            if connected_node_id not in subgraph_nodes:
-                                connected_node = self._nodes.get(str(connected_node_id))
-                                if connected_node:
-                                    next_level.append(connected_node)
-                                    subgraph_nodes.add(connected_node_id)
-                    # Incoming edge
-                    elif direction in ["incoming", "all"] and edge.target_id == node.id:
-                        if edge.id not in subgraph_edges:
-                            subgraph_edges.add(edge.id)
-
-                            # Add connected nodes
-                            connected_node_id = edge.source_id
-                            if connected_node_id not in subgraph_nodes:
-                                connected_node = self._nodes.get(str(connected_node_id))
-                                if connected_node:
-                                    next_level.append(connected_node)
-                                    subgraph_nodes.add(connected_node_id)
-            
-            current_level = next_level
-            if not current_level:
-                break
+        for layer_nodes, layer_edges in self._subgraph_layers(central_nodes, depth, direction)[:depth + 1]:
+            subgraph_nodes.update(layer_nodes)
+            subgraph_edges.update(layer_edges)
         
         # Build result
         result_nodes = []
@@ -439,6 +556,185 @@ class InMemoryGraphStore:
             'central_nodes': [str(node.id) for node in central_nodes]
         }
     
+    def _subgraph_layers(self, central_nodes: List[Node], depth: int, direction: str) -> _SubgraphLayers:
+        """Return the BFS layers around the central nodes up to the given depth.
+        
+        Layer 0 holds the central nodes; layer k holds the nodes first reached
+        and the edges traversed at step k. Layers are cached until the next
+        mutation and only the missing ones are computed, so a shallower call
+        reuses the walk of a deeper one and vice versa. At most
+        ``_SUBGRAPH_CACHE_MAXSIZE`` traversals are kept.
+        
+        Args:
+            central_nodes: Nodes the traversal starts from.
+            depth: Number of expansion steps required.
+            direction: Relationship direction ("incoming", "outgoing", "all").
+            
+        Returns:
+            The (node ids, edge ids) layers; fewer than depth + 1 when the
+            traversal runs out of nodes earlier.
+        """
+        cache_key = (tuple(node.id for node in central_nodes), direction)
+        entry = self._subgraph_cache.get(cache_key)
+        if entry is None:
+            central_ids = [node.id for node in central_nodes]
+            entry = ([(central_ids, [])], set(central_ids), set())
+            self._subgraph_cache[cache_key] = entry
+            if len(self._subgraph_cache) > self._SUBGRAPH_CACHE_MAXSIZE:
+                self._subgraph_cache.popitem(last=False)
+        else:
+            self._subgraph_cache.move_to_end(cache_key)
+        layers, subgraph_nodes, subgraph_edges = entry
+        
+        while len(layers) <= depth and layers[-1][0]:
+            next_nodes: List[UUID] = []
+            next_edges: List[UUID] = []
+            
+            for node_id in layers[-1][0]:
+                # Walk the edges connected to this node through the adjacency index
+                neighbours: List[Tuple[str, bool]] = []
+                if direction in ["outgoing", "all"]:
+                    neighbours.extend((edge_id, True) for edge_id in self._out_edges.get(node_id, ()))
+                if direction in ["incoming", "all"]:
+                    neighbours.extend((edge_id, False) for edge_id in self._in_edges.get(node_id, ()))
+                
+                for edge_id, outgoing in neighbours:
+                    edge = self._edges[edge_id]
+                    if edge.id in subgraph_edges:
+                        continue
+                    subgraph_edges.add(edge.id)
+                    next_edges.append(edge.id)
+                    
+                    # Add connected nodes
+                    connected_node_id = edge.target_id if outgoing else edge.source_id
+                    if connected_node_id not in subgraph_nodes and str(connected_node_id) in self._nodes:
+                        subgraph_nodes.add(connected_node_id)
+                        next_nodes.append(connected_node_id)
+            
+            layers.append((next_nodes, next_edges))
+        
+        return layers
+    
+    def match_nodes(self, match: MatchSpec) -> List[Node]:
+        """Find nodes matching the given specification.
+
+        The id, natural key, label and key indexes are probed first and only
+        the smallest candidate set is checked against the full match rules,
+        so a full scan happens only for property-only specifications.
+
+        Args:
+            match: Specification for matching nodes.
+
+        Returns:
+            List of matching nodes in creation order.
+        """
+        matches = self._build_node_matcher(match)
+        nodes = self._nodes
+        return [node for node in map(nodes.__getitem__, self._node_candidates(match)) if matches(node)]
+    
+    def get_node_by_key(self, key: str, label: Optional[str] = None) -> Optional[Node]:
+        """Get a node by its natural key.
+        
+        Args:
+            key: The natural key of the node.
+            label: Optional label; without it the first node created with
+                the key is returned.
+            
+        Returns:
+            The Node if found, None otherwise.
+        """
+        if label is not None:
+            node_uuid = self._node_key_to_id.get(f"{label}:{key}")
+            return self._nodes[str(node_uuid)] if node_uuid is not None else None
+        
+        for stored_id in self._key_index.get(key, ()):
+            return self._nodes[stored_id]
+        return None
+    
+    def _node_candidates(self, match: MatchSpec) -> Iterable[str]:
+        """Return the ids of the nodes that may match the specification.
+        
+        Args:
+            match: Match specification.
+            
+        Returns:
+            Node ids to check against the full match rules.
+        """
+        if match.id is not None:
+            node_id = str(match.id)
+            return (node_id,) if node_id in self._nodes else ()
+        
+        if match.label is not None and match.key is not None:
+            node_uuid = self._node_key_to_id.get(f"{match.label}:{match.key}")
+            return (str(node_uuid),) if node_uuid is not None else ()
+        
+        buckets = []
+        if match.label is not None:
+            buckets.append(self._label_index.get(match.label, {}))
+        if match.key is not None:
+            buckets.append(self._key_index.get(match.key, {}))
+        
+        if not buckets:
+            return self._nodes
+        return min(buckets, key=len)
+    
+    def match_edges(self, match: MatchSpec) -> List[Edge]:
+        """Find edges matching the given specification.
+
+        The id, relationship type and endpoint key indexes are probed first
+        and only the smallest candidate set is checked against the full match
+        rules, so a full scan happens only for property-only specifications.
+
+        Args:
+            match: Specification for matching edges; the label matches the
+                relationship type and the key matches either endpoint.
+
+        Returns:
+            List of matching edges in creation order.
+        """
+        matches = self._build_edge_matcher(match)
+        edges = self._edges
+        return [edge for edge in map(edges.__getitem__, self._edge_candidates(match)) if matches(edge)]
+    
+    def _edge_candidates(self, match: MatchSpec) -> Iterable[str]:
+        """Return the ids of the edges that may match the specification.
+        
+        Args:
+            match: Match specification.
+            
+        Returns:
+            Edge ids to check against the full match rules.
+        """
+        if match.id is not None:
+            edge_id = str(match.id)
+            return (edge_id,) if edge_id in self._edges else ()
+        
+        buckets = []
+        if match.label is not None:
+            buckets.append(self._edge_type_index.get(match.label, {}))
+        if match.key is not None:
+            buckets.append(self._edge_key_index.get(match.key, {}))
+        
+        if not buckets:
+            return self._edges
+        return min(buckets, key=len)
+    
+    @staticmethod
+    def _unindex(index: Dict[Any, Dict[str, None]], value: Hashable, item_id: str) -> None:
+        """Remove an id from a secondary index, dropping empty buckets.
+        
+        Args:
+            index: Secondary index to update.
+            value: Indexed value (label, key, node id, ...).
+            item_id: Id to remove.
+        """
+        bucket = index.get(value)
+        if bucket is None:
+            return
+        bucket.pop(item_id, None)
+        if not bucket:
+            del index[value]
+    
     def _matches_node(self, node: Node, match: MatchSpec) -> bool:
         """Check if a node matches the given specification.
         
@@ -449,25 +745,7 @@ class InMemoryGraphStore:
         Returns:
             True if the node matches, False otherwise.
         """
-        # Match by ID if specified
-        if match.id is not None and node.id != match.id:
-            return False
-        
-        # Match by label if specified
-        if match.label is not None and node.label != match.label:
-            return False
-        
-        # Match by key if specified
-        if match.key is not None and node.key != match.key:
-            return False
-        
-        # Match by properties if specified
-        if match.properties is not None:
-            for key, value in match.properties.items():
-                if key not in node.properties or node.properties[key] != value:
-                    return False
-        
-        return True
+        return self._build_node_matcher(match)(node)
     
     def _matches_edge(self, edge: Edge, match: MatchSpec) -> bool:
         """Check if an edge matches the given specification.
@@ -479,25 +757,77 @@ class InMemoryGraphStore:
         Returns:
             True if the edge matches, False otherwise.
         """
-        # Match by ID if specified
-        if match.id is not None and edge.id != match.id:
-            return False
-        
-        # Match by label if specified (relationship type)
-        if match.label is not None and edge.relationship_type != match.label:
-            return False
-        
-        # Match by key if specified (source or target key)
-        if match.key is not None and edge.source_key != match.key and edge.target_key != match.key:
-            return False
-        
-        # Match by properties if specified
-        if match.properties is not None:
-            for key, value in match.properties.items():
-                if key not in edge.properties or edge.properties[key] != value:
+        return self._build_edge_matcher(match)(edge)
+    
+    @staticmethod
+    def _build_node_matcher(match: MatchSpec) -> Callable[[Node], bool]:
+        """Build a node predicate for the given specification.
+        
+        The specification fields are read once here instead of once per
+        candidate node.
+        
+        Args:
+            match: Match specification.
+            
+        Returns:
+            Predicate returning True for nodes matching the specification.
+        """
+        match_id, label, key = match.id, match.label, match.key
+        properties = tuple(match.properties.items()) if match.properties else ()
+        
+        def matches(node: Node) -> bool:
+            # Match by ID, label and key if specified
+            if match_id is not None and node.id != match_id:
+                return False
+            if label is not None and node.label != label:
+                return False
+            if key is not None and node.key != key:
+                return False
+            
+            # Match by properties if specified
+            node_properties = node.properties
+            for prop, value in properties:
+                if prop not in node_properties or node_properties[prop] != value:
                     return False
+            
+            return True
+        
+        return matches
+    
+    @staticmethod
+    def _build_edge_matcher(match: MatchSpec) -> Callable[[Edge], bool]:
+        """Build an edge predicate for the given specification.
+        
+        The label matches the relationship type and the key matches either
+        endpoint key.
+        
+        Args:
+            match: Match specification.
+            
+        Returns:
+            Predicate returning True for edges matching the specification.
+        """
+        match_id, label, key = match.id, match.label, match.key
+        properties = tuple(match.properties.items()) if match.properties else ()
+        
+        def matches(edge: Edge) -> bool:
+            # Match by ID, relationship type and source or target key if specified
+            if match_id is not None and edge.id != match_id:
+                return False
+            if label is not None and edge.relationship_type != label:
+                return False
+            if key is not None and edge.source_key != key and edge.target_key != key:
+                return False
+            
+            # Match by properties if specified
+            edge_properties = edge.properties
+            for prop, value in properties:
+                if prop not in edge_properties or edge_properties[prop] != value:
+                    return False
+            
+            return True
         
-        return True
+        return matches
     
     def get_all_nodes(self) -> List[Node]:
         """Get all nodes in the graph.
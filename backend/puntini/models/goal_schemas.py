@@ -246,4 +246,4 @@ class GoalSpec(BaseModel):
         Returns:
             True if all todos are done, False otherwise.
         """
-        return len(self.get_remaining_todos()) == 0
+        return not any(todo.status == TodoStatus.PLANNED for todo in self.todo_list)
@@ -19,6 +19,8 @@ from ..models.errors import ValidationError
 from ..logging import get_logger
 from .message import ParseGoalResponse, ParseGoalResult, Artifact, Failure, ErrorContext
 
+logger = get_logger(__name__)
+
 
 def parse_goal(state: "State", config: Optional[RunnableConfig] = None, runtime: Optional[Runtime] = None) -> ParseGoalResponse:
     """Parse the goal and extract structured information using LLM.
@@ -45,9 +47,6 @@ def parse_goal(state: "State", config: Optional[RunnableConfig] = None, runtime:
         Uses progressive context disclosure - attempt 1 with minimal context.
         The LLM is obtained from the graph context to ensure consistency.
     """
-    # Initialize logger for this module
-    logger = get_logger(__name__)
-    
     # Access state attributes - handle both dict and object access
     logger.debug(f"State type: {type(state)}, State value: {state}")
     
@@ -193,14 +192,19 @@ Be precise, conservative with complexity, and keep responses concise."""),
         parsed_goal_dict = parsed_goal_spec.model_dump()
         logger.debug("Converted parsed goal to dictionary", extra={"dict_keys": list(parsed_goal_dict.keys())})
         
+        # Derive goal characteristics once; they are reused for routing, the result and logging
+        complexity = parsed_goal_spec.complexity.value if parsed_goal_spec.complexity else None
+        is_simple = parsed_goal_spec.is_simple_goal()
+        requires_graph_ops = parsed_goal_spec.requires_graph_operations()
+        
         # Determine next step based on complexity and parsing results
         next_step = _determine_next_step(parsed_goal_spec, current_attempt)
         logger.info(
             "Determined next step",
             extra={
                 "next_step": next_step,
-                "complexity": parsed_goal_spec.complexity.value if parsed_goal_spec.complexity else None,
-                "is_simple": parsed_goal_spec.is_simple_goal()
+                "complexity": complexity,
+                "is_simple": is_simple
             }
         )
         
@@ -212,9 +216,9 @@ Be precise, conservative with complexity, and keep responses concise."""),
             result=ParseGoalResult(
                 status="success",
                 parsed_goal=parsed_goal_dict,
-                complexity=parsed_goal_spec.complexity.value if parsed_goal_spec.complexity else None,
-                requires_graph_ops=parsed_goal_spec.requires_graph_operations(),
-                is_simple=parsed_goal_spec.is_simple_goal()
+                complexity=complexity,
+                requires_graph_ops=requires_graph_ops,
+                is_simple=is_simple
             ),
             goal_spec=parsed_goal_spec,  # Store GoalSpec directly in response
             todo_list=parsed_goal_spec.todo_list  # Store todo list directly in response
@@ -224,9 +228,9 @@ Be precise, conservative with complexity, and keep responses concise."""),
             "Goal parsing completed successfully",
             extra={
                 "next_step": next_step,
-                "complexity": parsed_goal_spec.complexity.value if parsed_goal_spec.complexity else None,
-                "requires_graph_ops": parsed_goal_spec.requires_graph_operations(),
-                "is_simple": parsed_goal_spec.is_simple_goal()
+                "complexity": complexity,
+                "requires_graph_ops": requires_graph_ops,
+                "is_simple": is_simple
             }
         )
         
@@ -325,8 +329,6 @@ def _determine_next_step(goal_spec: GoalSpec, current_attempt: int) -> str:
     Returns:
         The next step to execute.
     """
-    logger = get_logger(__name__)
-    
     # All goals should go through planning step first as per AGENTS.md specification
     # The planning step will determine the appropriate tool and create the tool signature
     logger.debug("Routing to planning step for all goals", extra={"complexity": goal_spec.complexity.value if goal_spec.complexity else None})
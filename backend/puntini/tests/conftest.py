@@ -4,6 +4,8 @@ This module provides common fixtures and configuration for testing
 the puntini agent system components.
 """
 
+import pickle
+
 import pytest
 from typing import Dict, Any, List
 from uuid import UUID
@@ -24,9 +26,8 @@ def graph_store() -> InMemoryGraphStore:
     return InMemoryGraphStore()
 
 
-@pytest.fixture
-def sample_node_specs() -> List[NodeSpec]:
-    """Create sample node specifications for testing.
+def _build_sample_node_specs() -> List[NodeSpec]:
+    """Build the sample node specifications shared by the graph fixtures.
     
     Returns:
         List of NodeSpec instances for testing.
@@ -55,9 +56,8 @@ def sample_node_specs() -> List[NodeSpec]:
     ]
 
 
-@pytest.fixture
-def sample_edge_specs() -> List[EdgeSpec]:
-    """Create sample edge specifications for testing.
+def _build_sample_edge_specs() -> List[EdgeSpec]:
+    """Build the sample edge specifications shared by the graph fixtures.
     
     Returns:
         List of EdgeSpec instances for testing.
@@ -90,29 +90,90 @@ def sample_edge_specs() -> List[EdgeSpec]:
     ]
 
 
-@pytest.fixture
-def populated_graph_store(graph_store: InMemoryGraphStore, sample_node_specs: List[NodeSpec], sample_edge_specs: List[EdgeSpec]) -> InMemoryGraphStore:
-    """Create a graph store populated with sample data.
+def _populate_graph(graph_store: InMemoryGraphStore, node_specs: List[NodeSpec], edge_specs: List[EdgeSpec]) -> InMemoryGraphStore:
+    """Add the given nodes and edges to a graph store.
     
     Args:
-        graph_store: Fresh InMemoryGraphStore instance.
-        sample_node_specs: Sample node specifications.
-        sample_edge_specs: Sample edge specifications.
+        graph_store: Graph store to populate.
+        node_specs: Node specifications to upsert.
+        edge_specs: Edge specifications to upsert.
         
     Returns:
-        Graph store populated with sample nodes and edges.
+        The populated graph store.
     """
     # Add nodes
-    for node_spec in sample_node_specs:
+    for node_spec in node_specs:
         graph_store.upsert_node(node_spec)
     
     # Add edges
-    for edge_spec in sample_edge_specs:
+    for edge_spec in edge_specs:
         graph_store.upsert_edge(edge_spec)
     
     return graph_store
 
 
+@pytest.fixture
+def sample_node_specs() -> List[NodeSpec]:
+    """Create sample node specifications for testing.
+    
+    Returns:
+        List of NodeSpec instances for testing.
+    """
+    return _build_sample_node_specs()
+
+
+@pytest.fixture
+def sample_edge_specs() -> List[EdgeSpec]:
+    """Create sample edge specifications for testing.
+    
+    Returns:
+        List of EdgeSpec instances for testing.
+    """
+    return _build_sample_edge_specs()
+
+
+@pytest.fixture(scope="session")
+def populated_graph_snapshot() -> bytes:
+    """Build the sample graph once and pickle it for per-test copies.
+    
+    Returns:
+        Pickled graph store populated with sample nodes and edges.
+    """
+    return pickle.dumps(_populate_graph(InMemoryGraphStore(), _build_sample_node_specs(), _build_sample_edge_specs()))
+
+
+@pytest.fixture
+def populated_graph_store(populated_graph_snapshot: bytes) -> InMemoryGraphStore:
+    """Create a graph store populated with sample data.
+    
+    Each test gets its own copy loaded from the pickled snapshot, which is
+    cheaper than replaying the upserts.
+    
+    Args:
+        populated_graph_snapshot: Pickled sample graph store.
+        
+    Returns:
+        Graph store populated with sample nodes and edges.
+    """
+    return pickle.loads(populated_graph_snapshot)
+
+
+@pytest.fixture(scope="module")
+def readonly_populated_graph_store(populated_graph_snapshot: bytes) -> InMemoryGraphStore:
+    """Create a populated graph store shared by all tests of a module.
+    
+    Tests using this fixture must not mutate the store; use
+    populated_graph_store for tests that write to the graph.
+    
+    Args:
+        populated_graph_snapshot: Pickled sample graph store.
+        
+    Returns:
+        Graph store populated with sample nodes and edges.
+    """
+    return pickle.loads(populated_graph_snapshot)
+
+
 @pytest.fixture
 def sample_match_specs() -> List[MatchSpec]:
     """Create sample match specifications for testing.
@@ -176,9 +237,8 @@ def invalid_edge_specs() -> List[EdgeSpec]:
     ]
 
 
-@pytest.fixture
-def complex_graph_data() -> Dict[str, Any]:
-    """Create complex graph data for integration testing.
+def _build_complex_graph_data() -> Dict[str, Any]:
+    """Build the complex graph data shared by the graph fixtures.
     
     Returns:
         Dictionary containing complex graph structure for testing.
@@ -207,16 +267,15 @@ def complex_graph_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def complex_populated_graph(graph_store: InMemoryGraphStore, complex_graph_data: Dict[str, Any]) -> InMemoryGraphStore:
-    """Create a graph store populated with complex data for integration testing.
+def _populate_complex_graph(graph_store: InMemoryGraphStore, complex_graph_data: Dict[str, Any]) -> InMemoryGraphStore:
+    """Add the nodes and edges described by complex graph data to a store.
     
     Args:
-        graph_store: Fresh InMemoryGraphStore instance.
+        graph_store: Graph store to populate.
         complex_graph_data: Complex graph data structure.
         
     Returns:
-        Graph store populated with complex data.
+        The populated graph store.
     """
     # Add nodes
     for node_data in complex_graph_data["nodes"]:
@@ -239,3 +298,55 @@ def complex_populated_graph(graph_store: InMemoryGraphStore, complex_graph_data:
         graph_store.upsert_edge(edge_spec)
     
     return graph_store
+
+
+@pytest.fixture
+def complex_graph_data() -> Dict[str, Any]:
+    """Create complex graph data for integration testing.
+    
+    Returns:
+        Dictionary containing complex graph structure for testing.
+    """
+    return _build_complex_graph_data()
+
+
+@pytest.fixture(scope="session")
+def complex_graph_snapshot() -> bytes:
+    """Build the complex graph once and pickle it for per-test copies.
+    
+    Returns:
+        Pickled graph store populated with complex data.
+    """
+    return pickle.dumps(_populate_complex_graph(InMemoryGraphStore(), _build_complex_graph_data()))
+
+
+@pytest.fixture
+def complex_populated_graph(complex_graph_snapshot: bytes) -> InMemoryGraphStore:
+    """Create a graph store populated with complex data for integration testing.
+    
+    Each test gets its own copy loaded from the pickled snapshot, which is
+    cheaper than replaying the upserts.
+    
+    Args:
+        complex_graph_snapshot: Pickled complex graph store.
+        
+    Returns:
+        Graph store populated with complex data.
+    """
+    return pickle.loads(complex_graph_snapshot)
+
+
+@pytest.fixture(scope="module")
+def readonly_complex_populated_graph(complex_graph_snapshot: bytes) -> InMemoryGraphStore:
+    """Create a complex populated graph store shared by all tests of a module.
+    
+    Tests using this fixture must not mutate the store; use
+    complex_populated_graph for tests that write to the graph.
+    
+    Args:
+        complex_graph_snapshot: Pickled complex graph store.
+        
+    Returns:
+        Graph store populated with complex data.
+    """
+    return pickle.loads(complex_graph_snapshot)
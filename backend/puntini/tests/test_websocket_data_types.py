@@ -1,7 +1,7 @@
 """Test to verify WebSocket sends correct data types for todo_list and other array fields."""
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -5,7 +5,7 @@ This module tests the core WebSocket error scenarios with simplified mocking.
 
 import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from fastapi import WebSocket
 from fastapi.testclient import TestClient
 
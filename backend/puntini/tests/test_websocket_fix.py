@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -101,7 +101,7 @@ class TestWebSocketFix:
         """Test that sending messages to closed connections is handled gracefully."""
         # Mock dependencies
         mock_websocket = AsyncMock()
-        mock_websocket.client_state = MagicMock()
+        mock_websocket.client_state = Mock()
         mock_websocket.client_state.name = "DISCONNECTED"  # Simulate closed connection
         mock_websocket.send_text = AsyncMock()
         
@@ -136,7 +136,7 @@ class TestWebSocketFix:
         """Test that RuntimeError from closed WebSocket is handled gracefully."""
         # Mock dependencies
         mock_websocket = AsyncMock()
-        mock_websocket.client_state = MagicMock()
+        mock_websocket.client_state = Mock()
         mock_websocket.client_state.name = "CONNECTED"
         mock_websocket.send_text = AsyncMock()
         
@@ -177,7 +177,7 @@ class TestWebSocketFix:
         
         # Mock a connected WebSocket
         mock_websocket = AsyncMock()
-        mock_websocket.client_state = MagicMock()
+        mock_websocket.client_state = Mock()
         mock_websocket.client_state.name = "CONNECTED"
         
         # Add to active connections
@@ -0,0 +1,76 @@
+"""Unit tests for the cypher_qa tool.
+
+This module tests the answers returned by cypher_qa, including the
+measured execution time and the validation of rows from the store.
+"""
+
+import importlib
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from puntini.graph.in_memory_graph import InMemoryGraphStore
+from puntini.tools.cypher_qa import cypher_qa
+
+# ``puntini.tools`` re-exports the cypher_qa function under the module's
+# name, so the module itself is looked up explicitly for monkeypatching.
+_cypher_qa_module = importlib.import_module("puntini.tools.cypher_qa")
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Make cypher_qa measure every query as taking ``duration`` seconds.
+
+    Returns:
+        Callable setting the measured duration.
+    """
+    clock = SimpleNamespace(now=0.0, duration=0.0)
+
+    def perf_counter():
+        clock.now += clock.duration
+        return clock.now
+
+    monkeypatch.setattr(_cypher_qa_module, "time", SimpleNamespace(perf_counter=perf_counter))
+
+    def set_duration(duration):
+        clock.duration = duration
+
+    return set_duration
+
+
+class TestCypherQA:
+    """Test cases for the cypher_qa function."""
+
+    def test_answer_reports_store_rows(self, populated_graph_store: InMemoryGraphStore):
+        """Test that a successful answer carries the rows returned by the store."""
+        answer = cypher_qa("Who is there?", populated_graph_store)
+
+        assert answer["status"] == "success"
+        assert answer["result"].results
+        assert answer["answer"] == f"Found {len(answer['result'].results)} results for: Who is there?"
+
+    def test_execution_time_is_measured(self, fake_clock, graph_store):
+        """Test that the result reports the measured query time."""
+        fake_clock(0.25)
+
+        result = cypher_qa("Who is there?", graph_store)["result"]
+
+        assert result.execution_time == pytest.approx(0.25)
+
+    def test_invalid_rows_are_reported_as_error(self):
+        """Test that rows from the store are validated before being returned."""
+        store = SimpleNamespace(run_cypher=Mock(return_value=(row for row in [{"n": 1}])))
+
+        answer = cypher_qa("Who is there?", store)
+
+        assert answer["status"] == "error"
+
+    def test_failed_query_is_reported_as_error(self, graph_store):
+        """Test that store exceptions become error answers."""
+        graph_store.run_cypher = Mock(side_effect=RuntimeError("boom"))
+
+        answer = cypher_qa("Who is there?", graph_store)
+
+        assert answer["status"] == "error"
+        assert answer["error"] == "boom"
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 
+from puntini.api import app as app_module
 from puntini.api.app import create_app
 from puntini.api.auth import get_current_user
 from puntini.api.models import GraphDataResponse, GraphNodeResponse, GraphEdgeResponse
@@ -13,6 +14,12 @@ from puntini.models.edge import Edge
 from puntini.models.specs import NodeSpec, EdgeSpec
 
 
+@pytest.fixture(scope="session")
+def unauth_client():
+    """Create a test client without the auth override, shared across tests."""
+    return TestClient(create_app())
+
+
 class TestGraphAPI:
     """Test cases for graph API endpoints."""
 
@@ -63,7 +70,7 @@ class TestGraphAPI:
         
         return store
 
-    @patch('puntini.api.app.session_manager')
+    @patch.object(app_module, 'session_manager')
     def test_get_graph_data_success(self, mock_session_manager, client, mock_graph_store):
         """Test successful graph data retrieval."""
         # Setup mocks
@@ -102,7 +109,7 @@ class TestGraphAPI:
         assert "source_id" in edge_data
         assert "target_id" in edge_data
 
-    @patch('puntini.api.app.session_manager')
+    @patch.object(app_module, 'session_manager')
     def test_get_graph_data_error(self, mock_session_manager, client):
         """Test graph data retrieval error handling."""
         # Setup mocks to raise exception
@@ -121,7 +128,7 @@ class TestGraphAPI:
         assert "detail" in data
         assert "Failed to retrieve graph data" in data["detail"]
 
-    @patch('puntini.api.app.session_manager')
+    @patch.object(app_module, 'session_manager')
     def test_get_subgraph_success(self, mock_session_manager, client, mock_graph_store):
         """Test successful subgraph retrieval."""
         # Setup mocks
@@ -149,23 +156,12 @@ class TestGraphAPI:
         assert data["depth"] == 1
         assert len(data["central_nodes"]) == 1
 
-    def test_get_graph_data_unauthorized(self):
-        """Test graph data retrieval without authentication."""
-        # Create app without auth override
-        app = create_app()
-        client = TestClient(app)
-        response = client.get("/graph")
-        assert response.status_code == 403  # FastAPI returns 403 for missing auth
-
-    def test_get_subgraph_unauthorized(self):
-        """Test subgraph retrieval without authentication."""
-        # Create app without auth override
-        app = create_app()
-        client = TestClient(app)
-        request_data = {
-            "match_spec": {"label": "Person"},
-            "depth": 1
-        }
-        
-        response = client.post("/graph/subgraph", json=request_data)
-        assert response.status_code == 403  # FastAPI returns 403 for missing auth
+    @pytest.mark.parametrize("method,path,json", [
+        ("GET", "/graph", None),
+        ("POST", "/graph/subgraph", {"match_spec": {"label": "Person"}, "depth": 1}),
+    ], ids=["graph_data", "subgraph"])
+    def test_unauthorized(self, unauth_client, method, path, json):
+        """Test graph endpoints reject requests without authentication."""
+        response = unauth_client.request(method, path, json=json)
+        # HTTPBearer rejects requests without credentials as unauthenticated
+        assert response.status_code == 401
@@ -4,6 +4,8 @@ This module contains comprehensive unit tests for the InMemoryGraphStore
 class, testing all methods and edge cases according to the GraphStore protocol.
 """
 
+import re
+
 import pytest
 from typing import Dict, Any, List
 from uuid import UUID
@@ -12,7 +14,24 @@ from puntini.graph.in_memory_graph import InMemoryGraphStore
 from puntini.models.specs import NodeSpec, EdgeSpec, MatchSpec
 from puntini.models.node import Node
 from puntini.models.edge import Edge
-from puntini.models.errors import ValidationError, NotFoundError
+from puntini.models.errors import AgentError, ValidationError, NotFoundError
+
+
+# Match specs are frozen, so the ones reused across tests are built once.
+_MATCH_JOHN = MatchSpec(label="Person", key="john_doe")
+_MATCH_KNOWS = MatchSpec(label="KNOWS")
+_MATCH_NONEXISTENT = MatchSpec(label="Nonexistent")
+_UUID_ZERO = UUID(int=0)
+
+# Error message patterns shared by the pytest.raises(match=...) checks.
+_RX_NODE_REQUIRED = re.compile("Node label and key are required")
+_RX_EDGE_REQUIRED = re.compile("Edge relationship type, source key, and target key are required")
+_RX_SOURCE_NOT_FOUND = re.compile("Source node not found")
+_RX_TARGET_NOT_FOUND = re.compile("Target node not found")
+_RX_NO_MATCH = re.compile("No matching nodes or edges found")
+_RX_NO_MATCHING_NODES = re.compile("No matching nodes found")
+_RX_NO_MATCHING_EDGES = re.compile("No matching edges found")
+_RX_NEGATIVE_DEPTH = re.compile("Depth must be non-negative")
 
 
 class TestInMemoryGraphStoreInitialization:
@@ -28,6 +47,23 @@ class TestInMemoryGraphStoreInitialization:
         assert hasattr(store, '_edge_key_to_id')
         assert len(store._nodes) == 0
         assert len(store._edges) == 0
+    
+    def test_version_bumps_on_mutation(self, sample_node_specs):
+        """Test that version starts at zero and changes with every write."""
+        store = InMemoryGraphStore()
+        assert store.version == 0
+        
+        store.upsert_node(sample_node_specs[0])
+        created = store.version
+        assert created > 0
+        
+        store.update_props(MatchSpec(label=sample_node_specs[0].label, key=sample_node_specs[0].key), {"age": 31})
+        assert store.version > created
+        
+        # Reads leave the version untouched
+        versioned = store.version
+        store.match_nodes(MatchSpec(label=sample_node_specs[0].label))
+        assert store.version == versioned
 
 
 class TestNodeOperations:
@@ -67,15 +103,37 @@ class TestNodeOperations:
         assert updated_node.properties["city"] == "San Francisco"
         assert updated_node.properties["name"] == "John Doe"  # Original property preserved
     
-    def test_upsert_node_validation_error_empty_label(self, graph_store: InMemoryGraphStore):
-        """Test that upsert_node raises ValidationError for empty label."""
-        with pytest.raises(ValidationError, match="Node label and key are required"):
-            graph_store.upsert_node(NodeSpec(label="", key="test"))
-    
-    def test_upsert_node_validation_error_empty_key(self, graph_store: InMemoryGraphStore):
-        """Test that upsert_node raises ValidationError for empty key."""
-        with pytest.raises(ValidationError, match="Node label and key are required"):
-            graph_store.upsert_node(NodeSpec(label="Person", key=""))
+    @pytest.mark.parametrize("label,key", [
+        ("", "test"),  # Empty label
+        ("Person", ""),  # Empty key
+    ], ids=["empty_label", "empty_key"])
+    def test_upsert_node_validation_error(self, graph_store: InMemoryGraphStore, label: str, key: str):
+        """Test that upsert_node raises ValidationError for an empty label or key."""
+        with pytest.raises(ValidationError, match=_RX_NODE_REQUIRED):
+            graph_store.upsert_node(NodeSpec(label=label, key=key))
+    
+    def test_upsert_nodes_bulk_creates_all_nodes(self, graph_store: InMemoryGraphStore, sample_node_specs: List[NodeSpec]):
+        """Test that upsert_nodes_bulk persists every spec in order."""
+        nodes = graph_store.upsert_nodes_bulk(sample_node_specs)
+        
+        assert [node.key for node in nodes] == [spec.key for spec in sample_node_specs]
+        assert len(graph_store._nodes) == len(sample_node_specs)
+        # The whole batch counts as a single mutation
+        assert graph_store.version == 1
+    
+    def test_upsert_nodes_bulk_validates_before_writing(self, graph_store: InMemoryGraphStore, sample_node_specs: List[NodeSpec]):
+        """Test that an invalid spec leaves the store unchanged."""
+        with pytest.raises(ValidationError, match=_RX_NODE_REQUIRED):
+            graph_store.upsert_nodes_bulk(sample_node_specs + [NodeSpec(label="Person", key="")])
+        
+        assert len(graph_store._nodes) == 0
+    
+    def test_get_node_by_key(self, populated_graph_store: InMemoryGraphStore):
+        """Test that get_node_by_key finds nodes with and without a label."""
+        assert populated_graph_store.get_node_by_key("john_doe").label == "Person"
+        assert populated_graph_store.get_node_by_key("john_doe", label="Person").key == "john_doe"
+        assert populated_graph_store.get_node_by_key("john_doe", label="Company") is None
+        assert populated_graph_store.get_node_by_key("nonexistent") is None
     
     def test_upsert_node_idempotent(self, graph_store: InMemoryGraphStore, sample_node_specs: List[NodeSpec]):
         """Test that multiple calls to upsert_node with same spec are idempotent."""
@@ -145,42 +203,25 @@ class TestEdgeOperations:
             if key != "updated":
                 assert updated_edge.properties[key] == value
     
-    def test_upsert_edge_validation_error_empty_relationship_type(self, populated_graph_store: InMemoryGraphStore):
-        """Test that upsert_edge raises ValidationError for empty relationship type."""
-        with pytest.raises(ValidationError, match="Edge relationship type, source key, and target key are required"):
+    @pytest.mark.parametrize("rel,src,tgt", [
+        ("", "john_doe", "jane_smith"),  # Empty relationship type
+        ("KNOWS", "", "jane_smith"),  # Empty source key
+        ("KNOWS", "john_doe", ""),  # Empty target key
+    ], ids=["empty_relationship_type", "empty_source_key", "empty_target_key"])
+    def test_upsert_edge_validation_error(self, populated_graph_store: InMemoryGraphStore, rel: str, src: str, tgt: str):
+        """Test that upsert_edge raises ValidationError for an empty type, source or target key."""
+        with pytest.raises(ValidationError, match=_RX_EDGE_REQUIRED):
             populated_graph_store.upsert_edge(EdgeSpec(
-                relationship_type="",
-                source_key="john_doe",
-                target_key="jane_smith",
-                source_label="Person",
-                target_label="Person"
-            ))
-    
-    def test_upsert_edge_validation_error_empty_source_key(self, populated_graph_store: InMemoryGraphStore):
-        """Test that upsert_edge raises ValidationError for empty source key."""
-        with pytest.raises(ValidationError, match="Edge relationship type, source key, and target key are required"):
-            populated_graph_store.upsert_edge(EdgeSpec(
-                relationship_type="KNOWS",
-                source_key="",
-                target_key="jane_smith",
-                source_label="Person",
-                target_label="Person"
-            ))
-    
-    def test_upsert_edge_validation_error_empty_target_key(self, populated_graph_store: InMemoryGraphStore):
-        """Test that upsert_edge raises ValidationError for empty target key."""
-        with pytest.raises(ValidationError, match="Edge relationship type, source key, and target key are required"):
-            populated_graph_store.upsert_edge(EdgeSpec(
-                relationship_type="KNOWS",
-                source_key="john_doe",
-                target_key="",
+                relationship_type=rel,
+                source_key=src,
+                target_key=tgt,
                 source_label="Person",
                 target_label="Person"
             ))
     
     def test_upsert_edge_not_found_error_missing_source(self, populated_graph_store: InMemoryGraphStore):
         """Test that upsert_edge raises NotFoundError for missing source node."""
-        with pytest.raises(NotFoundError, match="Source node not found"):
+        with pytest.raises(NotFoundError, match=_RX_SOURCE_NOT_FOUND):
             populated_graph_store.upsert_edge(EdgeSpec(
                 relationship_type="KNOWS",
                 source_key="nonexistent",
@@ -191,7 +232,7 @@ class TestEdgeOperations:
     
     def test_upsert_edge_not_found_error_missing_target(self, populated_graph_store: InMemoryGraphStore):
         """Test that upsert_edge raises NotFoundError for missing target node."""
-        with pytest.raises(NotFoundError, match="Target node not found"):
+        with pytest.raises(NotFoundError, match=_RX_TARGET_NOT_FOUND):
             populated_graph_store.upsert_edge(EdgeSpec(
                 relationship_type="KNOWS",
                 source_key="john_doe",
@@ -200,6 +241,20 @@ class TestEdgeOperations:
                 target_label="Person"
             ))
     
+    def test_upsert_edges_bulk_checks_endpoints_before_writing(self, populated_graph_store: InMemoryGraphStore):
+        """Test that a missing endpoint leaves the edges unchanged."""
+        initial_edge_count = len(populated_graph_store._edges)
+        
+        with pytest.raises(NotFoundError, match=_RX_TARGET_NOT_FOUND):
+            populated_graph_store.upsert_edges_bulk([
+                EdgeSpec(relationship_type="KNOWS", source_key="jane_smith", target_key="john_doe",
+                         source_label="Person", target_label="Person"),
+                EdgeSpec(relationship_type="KNOWS", source_key="john_doe", target_key="nonexistent",
+                         source_label="Person", target_label="Person"),
+            ])
+        
+        assert len(populated_graph_store._edges) == initial_edge_count
+    
     def test_upsert_edge_idempotent(self, populated_graph_store: InMemoryGraphStore):
         """Test that multiple calls to upsert_edge with same spec are idempotent."""
         edge_spec = EdgeSpec(
@@ -229,7 +284,7 @@ class TestPropertyUpdateOperations:
     
     def test_update_props_updates_matching_nodes(self, populated_graph_store: InMemoryGraphStore):
         """Test that update_props updates properties of matching nodes."""
-        match_spec = MatchSpec(label="Person", key="john_doe")
+        match_spec = _MATCH_JOHN
         new_props = {"age": 31, "city": "San Francisco"}
         
         populated_graph_store.update_props(match_spec, new_props)
@@ -246,7 +301,7 @@ class TestPropertyUpdateOperations:
     
     def test_update_props_updates_matching_edges(self, populated_graph_store: InMemoryGraphStore):
         """Test that update_props updates properties of matching edges."""
-        match_spec = MatchSpec(label="KNOWS")  # Match by relationship type
+        match_spec = _MATCH_KNOWS  # Match by relationship type
         new_props = {"strength": "very_strong", "updated": True}
         
         populated_graph_store.update_props(match_spec, new_props)
@@ -263,9 +318,9 @@ class TestPropertyUpdateOperations:
     
     def test_update_props_no_matches_raises_error(self, populated_graph_store: InMemoryGraphStore):
         """Test that update_props raises NotFoundError when no matches found."""
-        match_spec = MatchSpec(label="Nonexistent")
+        match_spec = _MATCH_NONEXISTENT
         
-        with pytest.raises(NotFoundError, match="No matching nodes or edges found"):
+        with pytest.raises(NotFoundError, match=_RX_NO_MATCH):
             populated_graph_store.update_props(match_spec, {"test": "value"})
     
     def test_update_props_empty_properties_does_nothing(self, populated_graph_store: InMemoryGraphStore):
@@ -288,7 +343,7 @@ class TestDeletionOperations:
         initial_node_count = len(populated_graph_store._nodes)
         initial_edge_count = len(populated_graph_store._edges)
         
-        match_spec = MatchSpec(label="Person", key="john_doe")
+        match_spec = _MATCH_JOHN
         populated_graph_store.delete_node(match_spec)
         
         # Node should be removed
@@ -300,12 +355,34 @@ class TestDeletionOperations:
         # Verify node is gone
         for node in populated_graph_store._nodes.values():
             assert node.key != "john_doe"
-    
+
+    def test_delete_node_updates_secondary_indexes(self, populated_graph_store: InMemoryGraphStore):
+        """Test that deleted nodes are no longer returned by match_nodes."""
+        person_count = len(populated_graph_store.match_nodes(MatchSpec(label="Person")))
+
+        populated_graph_store.delete_node(_MATCH_JOHN)
+
+        assert populated_graph_store.match_nodes(MatchSpec(key="john_doe")) == []
+        assert len(populated_graph_store.match_nodes(MatchSpec(label="Person"))) == person_count - 1
+        assert "john_doe" not in populated_graph_store._key_index
+
+    def test_delete_node_updates_adjacency_index(self, populated_graph_store: InMemoryGraphStore):
+        """Test that edges removed with a node are dropped from the adjacency index."""
+        populated_graph_store.delete_node(_MATCH_JOHN)
+
+        indexed_edges = {
+            edge_id
+            for adjacency in (populated_graph_store._out_edges, populated_graph_store._in_edges)
+            for edges in adjacency.values()
+            for edge_id in edges
+        }
+        assert indexed_edges == set(populated_graph_store._edges)
+
     def test_delete_node_no_matches_raises_error(self, populated_graph_store: InMemoryGraphStore):
         """Test that delete_node raises NotFoundError when no matches found."""
-        match_spec = MatchSpec(label="Nonexistent")
+        match_spec = _MATCH_NONEXISTENT
         
-        with pytest.raises(NotFoundError, match="No matching nodes found"):
+        with pytest.raises(NotFoundError, match=_RX_NO_MATCHING_NODES):
             populated_graph_store.delete_node(match_spec)
     
     def test_delete_edge_removes_edge_only(self, populated_graph_store: InMemoryGraphStore):
@@ -313,7 +390,7 @@ class TestDeletionOperations:
         initial_node_count = len(populated_graph_store._nodes)
         initial_edge_count = len(populated_graph_store._edges)
         
-        match_spec = MatchSpec(label="KNOWS")
+        match_spec = _MATCH_KNOWS
         populated_graph_store.delete_edge(match_spec)
         
         # Edge should be removed
@@ -326,11 +403,19 @@ class TestDeletionOperations:
         for edge in populated_graph_store._edges.values():
             assert edge.relationship_type != "KNOWS"
     
+    def test_delete_edge_updates_edge_indexes(self, populated_graph_store: InMemoryGraphStore):
+        """Test that deleted edges are no longer returned by match_edges."""
+        populated_graph_store.delete_edge(_MATCH_KNOWS)
+        
+        assert populated_graph_store.match_edges(_MATCH_KNOWS) == []
+        assert "KNOWS" not in populated_graph_store._edge_type_index
+        assert len(populated_graph_store.match_edges(MatchSpec(key="john_doe"))) == 1
+    
     def test_delete_edge_no_matches_raises_error(self, populated_graph_store: InMemoryGraphStore):
         """Test that delete_edge raises NotFoundError when no matches found."""
-        match_spec = MatchSpec(label="Nonexistent")
+        match_spec = _MATCH_NONEXISTENT
         
-        with pytest.raises(NotFoundError, match="No matching edges found"):
+        with pytest.raises(NotFoundError, match=_RX_NO_MATCHING_EDGES):
             populated_graph_store.delete_edge(match_spec)
 
 
@@ -388,7 +473,7 @@ class TestSubgraphOperations:
     
     def test_get_subgraph_returns_central_node_and_connections(self, populated_graph_store: InMemoryGraphStore):
         """Test that get_subgraph returns central node and its connections."""
-        match_spec = MatchSpec(label="Person", key="john_doe")
+        match_spec = _MATCH_JOHN
         subgraph = populated_graph_store.get_subgraph(match_spec, depth=1)
         
         assert isinstance(subgraph, dict)
@@ -404,27 +489,68 @@ class TestSubgraphOperations:
     
     def test_get_subgraph_no_matches_raises_error(self, populated_graph_store: InMemoryGraphStore):
         """Test that get_subgraph raises NotFoundError when no matches found."""
-        match_spec = MatchSpec(label="Nonexistent")
+        match_spec = _MATCH_NONEXISTENT
         
-        with pytest.raises(NotFoundError, match="No matching nodes found"):
+        with pytest.raises(NotFoundError, match=_RX_NO_MATCHING_NODES):
             populated_graph_store.get_subgraph(match_spec)
     
     def test_get_subgraph_negative_depth_raises_error(self, populated_graph_store: InMemoryGraphStore):
         """Test that get_subgraph raises ValidationError for negative depth."""
-        match_spec = MatchSpec(label="Person", key="john_doe")
+        match_spec = _MATCH_JOHN
         
-        with pytest.raises(ValidationError, match="Depth must be non-negative"):
+        with pytest.raises(ValidationError, match=_RX_NEGATIVE_DEPTH):
             populated_graph_store.get_subgraph(match_spec, depth=-1)
     
     def test_get_subgraph_depth_zero_returns_only_central_nodes(self, populated_graph_store: InMemoryGraphStore):
         """Test that get_subgraph with depth 0 returns only central nodes."""
-        match_spec = MatchSpec(label="Person", key="john_doe")
+        match_spec = _MATCH_JOHN
         subgraph = populated_graph_store.get_subgraph(match_spec, depth=0)
         
         assert len(subgraph["nodes"]) == 1
         assert len(subgraph["edges"]) == 0
         assert subgraph["depth"] == 0
 
+    def test_get_subgraph_cached_layers_match_fresh_traversal(self, complex_populated_graph: InMemoryGraphStore):
+        """Test that a shallow call after a deep one returns the same subgraph as a fresh walk."""
+        match_spec = MatchSpec(label="Person", key="alice")
+        complex_populated_graph.get_subgraph(match_spec, depth=3)
+        cached = complex_populated_graph.get_subgraph(match_spec, depth=1)
+
+        complex_populated_graph._subgraph_cache.clear()
+        fresh = complex_populated_graph.get_subgraph(match_spec, depth=1)
+
+        assert {node["id"] for node in cached["nodes"]} == {node["id"] for node in fresh["nodes"]}
+        assert {edge["id"] for edge in cached["edges"]} == {edge["id"] for edge in fresh["edges"]}
+
+    def test_get_subgraph_cache_evicts_least_recently_used(self, complex_populated_graph: InMemoryGraphStore):
+        """Test that the traversal cache keeps only the most recently used entries."""
+        complex_populated_graph._SUBGRAPH_CACHE_MAXSIZE = 2
+        alice = MatchSpec(label="Person", key="alice")
+        
+        complex_populated_graph.get_subgraph(alice, depth=1)
+        complex_populated_graph.get_subgraph(alice, depth=1, direction="outgoing")
+        complex_populated_graph.get_subgraph(alice, depth=1)
+        complex_populated_graph.get_subgraph(alice, depth=1, direction="incoming")
+        
+        assert [direction for _, direction in complex_populated_graph._subgraph_cache] == ["all", "incoming"]
+
+    def test_get_subgraph_reflects_mutations(self, populated_graph_store: InMemoryGraphStore):
+        """Test that cached traversals are invalidated when the graph changes."""
+        before = populated_graph_store.get_subgraph(_MATCH_JOHN, depth=1)
+
+        populated_graph_store.upsert_node(NodeSpec(label="Skill", key="python"))
+        populated_graph_store.upsert_edge(EdgeSpec(
+            relationship_type="HAS_SKILL",
+            source_key="john_doe",
+            target_key="python",
+            source_label="Person",
+            target_label="Skill"
+        ))
+        after = populated_graph_store.get_subgraph(_MATCH_JOHN, depth=1)
+
+        assert len(after["nodes"]) == len(before["nodes"]) + 1
+        assert len(after["edges"]) == len(before["edges"]) + 1
+
 
 class TestMatchingOperations:
     """Test internal matching operations."""
@@ -438,7 +564,7 @@ class TestMatchingOperations:
         assert populated_graph_store._matches_node(node, match_spec)
         
         # Test with different ID
-        different_id = UUID('00000000-0000-0000-0000-000000000000')
+        different_id = _UUID_ZERO
         match_spec_different = MatchSpec(id=different_id)
         assert not populated_graph_store._matches_node(node, match_spec_different)
     
@@ -494,24 +620,18 @@ class TestErrorHandling:
     
     def test_validation_error_inheritance(self):
         """Test that ValidationError inherits from AgentError."""
-        from puntini.models.errors import ValidationError, AgentError
-        
         error = ValidationError("Test message")
         assert isinstance(error, AgentError)
         assert error.message == "Test message"
     
     def test_not_found_error_inheritance(self):
         """Test that NotFoundError inherits from AgentError."""
-        from puntini.models.errors import NotFoundError, AgentError
-        
         error = NotFoundError("Test message")
         assert isinstance(error, AgentError)
         assert error.message == "Test message"
     
     def test_error_with_details(self):
         """Test that errors can include additional details."""
-        from puntini.models.errors import ValidationError
-        
         error = ValidationError("Test message", details={"field": "value"})
         assert error.details == {"field": "value"}
 
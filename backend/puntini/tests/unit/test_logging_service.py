@@ -9,7 +9,7 @@ import pytest
 import tempfile
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from typing import Dict, Any
 import io
 import logging
@@ -12,6 +12,22 @@ from puntini.models.specs import NodeSpec, EdgeSpec, MatchSpec
 from puntini.models.errors import ValidationError, NotFoundError
 
 
+# Property round-trip cases, checked in one test each to avoid per-case setup.
+_EDGE_PROPERTY_CASES = [
+    {"string": "test"},
+    {"integer": 42},
+    {"float": 3.14},
+    {"boolean": True},
+    {"list": [1, 2, 3]},
+    {"dict": {"nested": "value"}},
+]
+_NODE_PROPERTY_CASES = _EDGE_PROPERTY_CASES + [
+    {"boolean_false": False},
+    {"none": None},
+    {"mixed": {"str": "test", "int": 42, "bool": True, "list": [1, 2, 3]}},
+]
+
+
 class TestParametrizedNodeOperations:
     """Parametrized tests for node operations."""
     
@@ -23,7 +39,7 @@ class TestParametrizedNodeOperations:
         ("", "valid_key", {}, True, ValidationError),  # Empty label
         ("ValidLabel", "", {}, True, ValidationError),  # Empty key
         ("ValidLabel", "valid_key", {"valid": "value"}, False, None),
-    ])
+    ], ids=["person", "company", "no_properties", "empty_label", "empty_key", "valid_properties"])
     def test_upsert_node_validation(self, graph_store: InMemoryGraphStore, label: str, key: str, properties: Dict[str, Any], should_raise: bool, error_type):
         """Test node validation with various inputs."""
         node_spec = NodeSpec(label=label, key=key, properties=properties)
@@ -42,7 +58,7 @@ class TestParametrizedNodeOperations:
         ({"age": 31}, {"name": "John", "age": 31}),  # Single update
         ({"age": 31, "city": "NYC"}, {"name": "John", "age": 31, "city": "NYC"}),  # Multiple updates
         ({"age": 31, "name": "Johnny"}, {"name": "Johnny", "age": 31}),  # Override existing
-    ])
+    ], ids=["no_updates", "single_update", "multiple_updates", "override_existing"])
     def test_node_property_updates(self, graph_store: InMemoryGraphStore, properties_updates: Dict[str, Any], expected_properties: Dict[str, Any]):
         """Test various property update scenarios."""
         # Create initial node
@@ -53,12 +69,9 @@ class TestParametrizedNodeOperations:
         graph_store.update_props(MatchSpec(label="Person", key="john"), properties_updates)
         
         # Verify final properties
-        for node in graph_store._nodes.values():
-            if node.key == "john":
-                assert node.properties == expected_properties
-                break
-        else:
-            pytest.fail("Node not found")
+        node = graph_store.get_node_by_key("john", label="Person")
+        assert node is not None
+        assert node.properties == expected_properties
 
 
 class TestParametrizedEdgeOperations:
@@ -71,7 +84,7 @@ class TestParametrizedEdgeOperations:
         ("", "john_doe", "jane_smith", "Person", "Person", True, ValidationError),  # Empty relationship type
         ("KNOWS", "", "jane_smith", "Person", "Person", True, ValidationError),  # Empty source key
         ("KNOWS", "john_doe", "", "Person", "Person", True, ValidationError),  # Empty target key
-    ])
+    ], ids=["knows", "works_for", "empty_relationship_type", "empty_source_key", "empty_target_key"])
     def test_upsert_edge_validation(self, populated_graph_store: InMemoryGraphStore, rel_type: str, source_key: str, target_key: str, source_label: str, target_label: str, should_raise: bool, error_type):
         """Test edge validation with various inputs."""
         edge_spec = EdgeSpec(
@@ -79,8 +92,7 @@ class TestParametrizedEdgeOperations:
             source_key=source_key,
             target_key=target_key,
             source_label=source_label,
-            target_label=target_label,
-            properties={}
+            target_label=target_label
         )
         
         if should_raise:
@@ -104,13 +116,10 @@ class TestParametrizedMatchingOperations:
         (MatchSpec(label="Person", properties={"city": "Boston"}), 1),  # Match by label and property
         (MatchSpec(label="Nonexistent"), 0),  # No matches
         (MatchSpec(properties={"nonexistent": "value"}), 0),  # No matches
-    ])
-    def test_node_matching_scenarios(self, populated_graph_store: InMemoryGraphStore, match_spec: MatchSpec, expected_matches: int):
+    ], ids=["by_label", "by_key", "by_property", "by_label_and_key", "by_label_and_property", "no_label_match", "no_property_match"])
+    def test_node_matching_scenarios(self, readonly_populated_graph_store: InMemoryGraphStore, match_spec: MatchSpec, expected_matches: int):
         """Test various node matching scenarios."""
-        matches = []
-        for node in populated_graph_store._nodes.values():
-            if populated_graph_store._matches_node(node, match_spec):
-                matches.append(node)
+        matches = readonly_populated_graph_store.match_nodes(match_spec)
         
         assert len(matches) == expected_matches
     
@@ -121,13 +130,10 @@ class TestParametrizedMatchingOperations:
         (MatchSpec(label="WORKS_FOR"), 1),  # Match by different relationship type
         (MatchSpec(label="Nonexistent"), 0),  # No matches
         (MatchSpec(properties={"nonexistent": "value"}), 0),  # No matches
-    ])
-    def test_edge_matching_scenarios(self, populated_graph_store: InMemoryGraphStore, match_spec: MatchSpec, expected_matches: int):
+    ], ids=["by_relationship_type", "by_source_or_target_key", "by_property", "by_other_relationship_type", "no_label_match", "no_property_match"])
+    def test_edge_matching_scenarios(self, readonly_populated_graph_store: InMemoryGraphStore, match_spec: MatchSpec, expected_matches: int):
         """Test various edge matching scenarios."""
-        matches = []
-        for edge in populated_graph_store._edges.values():
-            if populated_graph_store._matches_edge(edge, match_spec):
-                matches.append(edge)
+        matches = readonly_populated_graph_store.match_edges(match_spec)
         
         assert len(matches) == expected_matches
 
@@ -140,11 +146,11 @@ class TestParametrizedSubgraphOperations:
         (1, 6),  # Central node + 5 direct connections
         (2, 7),  # Includes nodes reachable in 2 steps
         (3, 7),  # Max depth reached
-    ])
-    def test_subgraph_depth_variations(self, complex_populated_graph: InMemoryGraphStore, depth: int, expected_nodes: int):
+    ], ids=["depth_0", "depth_1", "depth_2", "depth_3"])
+    def test_subgraph_depth_variations(self, readonly_complex_populated_graph: InMemoryGraphStore, depth: int, expected_nodes: int):
         """Test subgraph retrieval with various depths."""
         match_spec = MatchSpec(label="Person", key="alice")
-        subgraph = complex_populated_graph.get_subgraph(match_spec, depth=depth)
+        subgraph = readonly_complex_populated_graph.get_subgraph(match_spec, depth=depth)
         
         assert len(subgraph["nodes"]) == expected_nodes
         assert subgraph["depth"] == depth
@@ -154,14 +160,14 @@ class TestParametrizedSubgraphOperations:
         (MatchSpec(label="Person", key="bob"), False, None),  # Valid match
         (MatchSpec(label="Nonexistent"), True, NotFoundError),  # No matches
         (MatchSpec(key="nonexistent"), True, NotFoundError),  # No matches
-    ])
-    def test_subgraph_matching_scenarios(self, complex_populated_graph: InMemoryGraphStore, match_spec: MatchSpec, should_raise: bool, error_type):
+    ], ids=["alice", "bob", "nonexistent_label", "nonexistent_key"])
+    def test_subgraph_matching_scenarios(self, readonly_complex_populated_graph: InMemoryGraphStore, match_spec: MatchSpec, should_raise: bool, error_type):
         """Test subgraph retrieval with various matching scenarios."""
         if should_raise:
             with pytest.raises(error_type):
-                complex_populated_graph.get_subgraph(match_spec)
+                readonly_complex_populated_graph.get_subgraph(match_spec)
         else:
-            subgraph = complex_populated_graph.get_subgraph(match_spec)
+            subgraph = readonly_complex_populated_graph.get_subgraph(match_spec)
             assert isinstance(subgraph, dict)
             assert "nodes" in subgraph
             assert "edges" in subgraph
@@ -172,16 +178,16 @@ class TestParametrizedCypherOperations:
     """Parametrized tests for Cypher query operations."""
     
     @pytest.mark.parametrize("query,expected_type,expected_min_results", [
-        ("MATCH (n:Person) RETURN n", "list", 1),
-        ("MATCH (n:Company) RETURN n", "list", 1),
-        ("RETURN *", "list", 1),
-        ("UNSUPPORTED QUERY", "list", 0),
-    ])
-    def test_cypher_query_variations(self, populated_graph_store: InMemoryGraphStore, query: str, expected_type: str, expected_min_results: int):
+        ("MATCH (n:Person) RETURN n", list, 1),
+        ("MATCH (n:Company) RETURN n", list, 1),
+        ("RETURN *", list, 1),
+        ("UNSUPPORTED QUERY", list, 0),
+    ], ids=["match_person", "match_company", "return_all", "unsupported"])
+    def test_cypher_query_variations(self, readonly_populated_graph_store: InMemoryGraphStore, query: str, expected_type: type, expected_min_results: int):
         """Test various Cypher query patterns."""
-        results = populated_graph_store.run_cypher(query)
+        results = readonly_populated_graph_store.run_cypher(query)
         
-        assert isinstance(results, eval(expected_type))
+        assert isinstance(results, expected_type)
         assert len(results) >= expected_min_results
     
     @pytest.mark.parametrize("params,should_raise", [
@@ -189,94 +195,84 @@ class TestParametrizedCypherOperations:
         ({}, False),  # Empty parameters
         ({"key": "value"}, False),  # Valid parameters
         ({"key": None}, False),  # None value in parameters
-    ])
-    def test_cypher_query_parameters(self, populated_graph_store: InMemoryGraphStore, params: Dict[str, Any], should_raise: bool):
+    ], ids=["none", "empty", "value", "none_value"])
+    def test_cypher_query_parameters(self, readonly_populated_graph_store: InMemoryGraphStore, params: Dict[str, Any], should_raise: bool):
         """Test Cypher queries with various parameter types."""
         if should_raise:
             with pytest.raises(Exception):
-                populated_graph_store.run_cypher("MATCH (n) RETURN n", params)
+                readonly_populated_graph_store.run_cypher("MATCH (n) RETURN n", params)
         else:
-            results = populated_graph_store.run_cypher("MATCH (n) RETURN n", params)
+            results = readonly_populated_graph_store.run_cypher("MATCH (n) RETURN n", params)
             assert isinstance(results, list)
 
 
 class TestParametrizedErrorScenarios:
     """Parametrized tests for error scenarios."""
     
+    # Store-level checks are under test, so the invalid specs skip Pydantic validation.
     @pytest.mark.parametrize("operation,args,expected_error", [
-        ("upsert_node", (NodeSpec(label="", key="test"),), ValidationError),
-        ("upsert_node", (NodeSpec(label="test", key=""),), ValidationError),
-        ("upsert_edge", (EdgeSpec(relationship_type="", source_key="a", target_key="b", source_label="A", target_label="B"),), ValidationError),
-        ("upsert_edge", (EdgeSpec(relationship_type="REL", source_key="", target_key="b", source_label="A", target_label="B"),), ValidationError),
-        ("upsert_edge", (EdgeSpec(relationship_type="REL", source_key="a", target_key="", source_label="A", target_label="B"),), ValidationError),
+        ("upsert_node", (NodeSpec.model_construct(label="", key="test"),), ValidationError),
+        ("upsert_node", (NodeSpec.model_construct(label="test", key=""),), ValidationError),
+        ("upsert_edge", (EdgeSpec.model_construct(relationship_type="", source_key="a", target_key="b", source_label="A", target_label="B"),), ValidationError),
+        ("upsert_edge", (EdgeSpec.model_construct(relationship_type="REL", source_key="", target_key="b", source_label="A", target_label="B"),), ValidationError),
+        ("upsert_edge", (EdgeSpec.model_construct(relationship_type="REL", source_key="a", target_key="", source_label="A", target_label="B"),), ValidationError),
         ("delete_node", (MatchSpec(label="Nonexistent"),), NotFoundError),
         ("delete_edge", (MatchSpec(label="Nonexistent"),), NotFoundError),
         ("update_props", (MatchSpec(label="Nonexistent"), {"test": "value"}), NotFoundError),
         ("get_subgraph", (MatchSpec(label="Nonexistent"),), NotFoundError),
-    ])
-    def test_error_scenarios(self, graph_store: InMemoryGraphStore, operation: str, args: Tuple, expected_error):
+    ], ids=["node_empty_label", "node_empty_key", "edge_empty_relationship_type", "edge_empty_source_key", "edge_empty_target_key", "delete_node_not_found", "delete_edge_not_found", "update_props_not_found", "get_subgraph_not_found"])
+    def test_error_scenarios(self, readonly_populated_graph_store: InMemoryGraphStore, operation: str, args: Tuple, expected_error):
         """Test various error scenarios."""
+        # Failing operations must not write, so the cases share one store
+        store = readonly_populated_graph_store
+        state_before = (len(store._nodes), len(store._edges), store.version)
+        
         with pytest.raises(expected_error):
-            getattr(graph_store, operation)(*args)
+            getattr(store, operation)(*args)
+        
+        assert (len(store._nodes), len(store._edges), store.version) == state_before
 
 
 class TestParametrizedDataTypes:
-    """Parametrized tests for various data types in properties."""
+    """Table-driven tests for various data types in properties."""
     
-    @pytest.mark.parametrize("properties", [
-        {"string": "test"},
-        {"integer": 42},
-        {"float": 3.14},
-        {"boolean": True},
-        {"boolean_false": False},
-        {"list": [1, 2, 3]},
-        {"dict": {"nested": "value"}},
-        {"none": None},
-        {"mixed": {"str": "test", "int": 42, "bool": True, "list": [1, 2, 3]}},
-    ])
-    def test_node_property_data_types(self, graph_store: InMemoryGraphStore, properties: Dict[str, Any]):
+    def test_node_property_data_types(self, graph_store: InMemoryGraphStore):
         """Test node properties with various data types."""
-        node_spec = NodeSpec(label="Test", key="test", properties=properties)
-        node = graph_store.upsert_node(node_spec)
-        
-        assert node.properties == properties
+        for i, properties in enumerate(_NODE_PROPERTY_CASES):
+            node_spec = NodeSpec(label="Test", key=f"test_{i}", properties=properties)
+            node = graph_store.upsert_node(node_spec)
+            
+            assert node.properties == properties, properties
     
-    @pytest.mark.parametrize("properties", [
-        {"string": "test"},
-        {"integer": 42},
-        {"float": 3.14},
-        {"boolean": True},
-        {"list": [1, 2, 3]},
-        {"dict": {"nested": "value"}},
-    ])
-    def test_edge_property_data_types(self, populated_graph_store: InMemoryGraphStore, properties: Dict[str, Any]):
+    def test_edge_property_data_types(self, populated_graph_store: InMemoryGraphStore):
         """Test edge properties with various data types."""
-        edge_spec = EdgeSpec(
-            relationship_type="TEST",
-            source_key="john_doe",
-            target_key="jane_smith",
-            source_label="Person",
-            target_label="Person",
-            properties=properties
-        )
-        edge = populated_graph_store.upsert_edge(edge_spec)
-        
-        assert edge.properties == properties
+        for i, properties in enumerate(_EDGE_PROPERTY_CASES):
+            edge_spec = EdgeSpec(
+                relationship_type=f"TEST_{i}",
+                source_key="john_doe",
+                target_key="jane_smith",
+                source_label="Person",
+                target_label="Person",
+                properties=properties
+            )
+            edge = populated_graph_store.upsert_edge(edge_spec)
+            
+            assert edge.properties == properties, properties
 
 
 class TestParametrizedBoundaryConditions:
     """Parametrized tests for boundary conditions."""
     
     @pytest.mark.parametrize("depth", [-1, 0, 1, 2, 10, 100])
-    def test_subgraph_depth_boundaries(self, complex_populated_graph: InMemoryGraphStore, depth: int):
+    def test_subgraph_depth_boundaries(self, readonly_complex_populated_graph: InMemoryGraphStore, depth: int):
         """Test subgraph retrieval with various depth values."""
         match_spec = MatchSpec(label="Person", key="alice")
         
         if depth < 0:
             with pytest.raises(ValidationError):
-                complex_populated_graph.get_subgraph(match_spec, depth=depth)
+                readonly_complex_populated_graph.get_subgraph(match_spec, depth=depth)
         else:
-            subgraph = complex_populated_graph.get_subgraph(match_spec, depth=depth)
+            subgraph = readonly_complex_populated_graph.get_subgraph(match_spec, depth=depth)
             assert subgraph["depth"] == depth
             assert len(subgraph["nodes"]) >= 1  # At least the central node
     
@@ -284,16 +280,18 @@ class TestParametrizedBoundaryConditions:
     def test_large_dataset_operations(self, graph_store: InMemoryGraphStore, count: int):
         """Test operations with various dataset sizes."""
         # Create nodes
-        for i in range(count):
-            node_spec = NodeSpec(label="Test", key=f"node_{i}", properties={"index": i})
-            graph_store.upsert_node(node_spec)
+        graph_store.upsert_nodes_bulk([
+            NodeSpec(label="Test", key=f"node_{i}", properties={"index": i})
+            for i in range(count)
+        ])
         
         assert len(graph_store._nodes) == count
         
         # Create edges (connect each node to next)
-        for i in range(count - 1):
-            edge_spec = EdgeSpec(relationship_type="CONNECTS", source_key=f"node_{i}", target_key=f"node_{i+1}", source_label="Test", target_label="Test", properties={})
-            graph_store.upsert_edge(edge_spec)
+        graph_store.upsert_edges_bulk([
+            EdgeSpec(relationship_type="CONNECTS", source_key=f"node_{i}", target_key=f"node_{i+1}", source_label="Test", target_label="Test")
+            for i in range(count - 1)
+        ])
         
         if count > 1:
             assert len(graph_store._edges) == count - 1
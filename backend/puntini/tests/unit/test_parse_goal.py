@@ -2,218 +2,226 @@
 
 This module tests the parse_goal node functionality including
 LLM integration, structured output parsing, and error handling.
+
+GoalSpec instances standing in for LLM output are known to be valid, so
+they are built with ``model_construct`` to skip Pydantic validation.
 """
 
+import importlib
+import re
+
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 from typing import Dict, Any
 
 from puntini.nodes.parse_goal import parse_goal, _determine_next_step
 from puntini.models.goal_schemas import GoalSpec, GoalComplexity, EntitySpec, EntityType
 from puntini.models.errors import ValidationError
 
+# ``puntini.nodes`` re-exports the parse_goal function under the module's
+# name, so the module itself is looked up explicitly for monkeypatching.
+_parse_goal_module = importlib.import_module("puntini.nodes.parse_goal")
+
+_EMPTY_GOAL_RE = re.compile(r"Goal cannot be empty")
+
+# LLM output with neither intent nor entities, which parse_goal rejects.
+_EMPTY_GOAL_SPEC = GoalSpec.model_construct(
+    original_goal="Create a person node",
+    intent="",
+    complexity=GoalComplexity.SIMPLE,
+    entities=[],
+    constraints=[],
+    domain_hints=[],
+    estimated_steps=1,
+    requires_human_input=False,
+    priority="medium",
+    confidence=0.9,
+    parsing_notes=[]
+)
+
+
+class _StubPrompt:
+    """Prompt stand-in whose ``|`` yields the test's parsing chain."""
+    
+    __slots__ = ("_chain",)
+    
+    def __init__(self, chain):
+        self._chain = chain
+    
+    def __or__(self, other):
+        return self._chain
+
+
+class _StubPromptTemplate:
+    """``ChatPromptTemplate`` stand-in whose prompts pipe into ``chain``."""
+    
+    __slots__ = ("_prompt",)
+    
+    def __init__(self, chain):
+        self._prompt = _StubPrompt(chain)
+    
+    def from_messages(self, messages):
+        return self._prompt
+
+
+@pytest.fixture(scope="class")
+def llm_mocks():
+    """Build the parse_goal LLM chain mocks once per test class.
+    
+    Returns:
+        Namespace with the ``llm`` stub and ``chain`` mock, a stub prompt
+        template piping into the chain and a ``runtime`` exposing the LLM.
+    """
+    # parse_goal only calls with_structured_output on the LLM
+    mock_llm = SimpleNamespace(with_structured_output=Mock())
+    # The parsing chain is only ever invoked
+    mock_chain = Mock(spec_set=["invoke"])
+    return SimpleNamespace(
+        llm=mock_llm,
+        chain=mock_chain,
+        prompt=_StubPromptTemplate(mock_chain),
+        runtime=SimpleNamespace(context={'llm': mock_llm}),
+    )
+
+
+@pytest.fixture
+def patched_llm(monkeypatch, llm_mocks):
+    """Patch the prompt template and runtime lookup used by parse_goal.
+    
+    Returns:
+        Callable taking ``goal_spec`` / ``exc`` that makes the parsing chain
+        return ``goal_spec`` or raise ``exc`` and returns the
+        (runtime, mock_llm, mock_chain) triple.
+    """
+    monkeypatch.setattr(_parse_goal_module, "ChatPromptTemplate", llm_mocks.prompt)
+    monkeypatch.setattr(_parse_goal_module, "get_runtime", lambda: llm_mocks.runtime)
+    
+    def configure(goal_spec=None, exc=None):
+        llm_mocks.chain.invoke.return_value = goal_spec
+        llm_mocks.chain.invoke.side_effect = exc
+        return llm_mocks.runtime, llm_mocks.llm, llm_mocks.chain
+    
+    yield configure
+    
+    # The mocks are shared by the class; clear what this test recorded
+    llm_mocks.llm.with_structured_output.reset_mock()
+    llm_mocks.chain.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def call_node(llm_mocks):
+    """Run parse_goal against the shared mocked runtime.
+    
+    Returns:
+        Callable taking ``goal`` and ``current_attempt`` that builds the
+        state and returns the parse_goal result.
+    """
+    runtime = llm_mocks.runtime
+    
+    def _call(goal, current_attempt=1):
+        return parse_goal({"goal": goal, "current_attempt": current_attempt}, runtime=runtime)
+    
+    return _call
+
 
 class TestParseGoal:
     """Test cases for the parse_goal function."""
     
-    def test_parse_goal_empty_goal(self):
-        """Test that empty goals raise ValidationError."""
-        state = {"goal": "", "current_attempt": 1}
+    @pytest.mark.parametrize("goal", ["", "   \n\t  "], ids=["empty", "whitespace_only"])
+    def test_parse_goal_empty_goal(self, goal):
+        """Test that empty or whitespace-only goals raise ValidationError."""
+        state = {"goal": goal, "current_attempt": 1}
         
-        with pytest.raises(ValidationError, match="Goal cannot be empty"):
+        with pytest.raises(ValidationError, match=_EMPTY_GOAL_RE):
             parse_goal(state)
     
-    def test_parse_goal_whitespace_only(self):
-        """Test that whitespace-only goals raise ValidationError."""
-        state = {"goal": "   \n\t  ", "current_attempt": 1}
+    @pytest.mark.parametrize("complexity,expected_is_simple", [
+        ("simple", True),
+        ("medium", False),
+        ("complex", False),
+    ], ids=["simple", "medium", "complex"])
+    def test_parse_goal_success(self, patched_llm, call_node, sample_goal_specs, complexity, expected_is_simple):
+        """Test successful goal parsing with mocked LLM for each complexity level."""
+        goal_spec = sample_goal_specs[complexity]
+        _, mock_llm, mock_chain = patched_llm(goal_spec=goal_spec)
         
-        with pytest.raises(ValidationError, match="Goal cannot be empty"):
-            parse_goal(state)
-    
-    @patch('puntini.nodes.parse_goal.get_runtime')
-    @patch('puntini.nodes.parse_goal.ChatPromptTemplate')
-    def test_parse_goal_success(self, mock_prompt, mock_get_runtime):
-        """Test successful goal parsing with mocked LLM."""
-        # Mock LLM and runtime
-        mock_llm = Mock()
-        mock_structured_llm = Mock()
-        mock_llm.with_structured_output.return_value = mock_structured_llm
-        mock_runtime = Mock()
-        mock_runtime.context = {'llm': mock_llm}
-        mock_get_runtime.return_value = mock_runtime
-
-        # Mock the LLM response
-        mock_goal_spec = GoalSpec(
-            original_goal="Create a person node",
-            intent="Create a person entity",
-            complexity=GoalComplexity.SIMPLE,
-            entities=[
-                EntitySpec(
-                    name="person",
-                    type=EntityType.NODE,
-                    label="Person"
-                )
-            ],
-            constraints=[],
-            domain_hints=[],
-            estimated_steps=1,
-            requires_human_input=False,
-            priority="medium",
-            confidence=0.9,
-            parsing_notes=["Successfully parsed simple goal"]
-        )
-        
-        mock_structured_llm.invoke.return_value = mock_goal_spec
-        
-        # Mock the prompt template
-        mock_chain = Mock()
-        mock_chain.invoke.return_value = mock_goal_spec
-        mock_prompt.from_messages.return_value.__or__ = Mock(return_value=mock_chain)
-        
-        state = {
-            "goal": "Create a person node called John",
-            "current_attempt": 1
-        }
-        
-        result = parse_goal(state, runtime=mock_runtime)
+        result = call_node(goal_spec.original_goal)
         
         # Verify the result structure
         assert result.current_step == "plan_step"
         assert result.current_attempt == 1
         assert result.result.status == "success"
-        assert result.result.complexity == GoalComplexity.SIMPLE.value
-        assert result.result.is_simple is True
-        assert len(result.progress) > 0
+        assert result.result.complexity == complexity
+        assert result.result.is_simple is expected_is_simple
+        assert result.result.requires_graph_ops is True
+        assert result.progress == [f"Parsed goal: {goal_spec.intent}"]
         
         # Verify LLM was called
         mock_llm.with_structured_output.assert_called_once()
         mock_chain.invoke.assert_called_once()
     
-    @patch('puntini.nodes.parse_goal.get_runtime')
-    def test_parse_goal_llm_error_first_attempt(self, mock_get_runtime):
-        """Test handling of LLM errors on first attempt."""
-        # Mock LLM to raise an exception
-        mock_llm = Mock()
-        mock_llm.with_structured_output.side_effect = Exception("LLM connection failed")
-        mock_runtime = Mock()
-        mock_runtime.context = {'llm': mock_llm}
-        mock_get_runtime.return_value = mock_runtime
-
-        state = {
-            "goal": "Create a person node",
-            "current_attempt": 1
-        }
+    @pytest.mark.parametrize(
+        "goal_spec,exc,current_attempt,expected_step,expected_attempt,expected_error_type,expected_retryable,expected_message",
+        [
+            # First network failure routes to diagnosis, a retry escalates to a human
+            (None, Exception("LLM connection failed"), 1, "diagnose", 2, "network_error", True, "LLM connection failed"),
+            (None, Exception("LLM connection failed"), 2, "escalate", 2, "network_error", True, "LLM connection failed"),
+            (None, Exception("Invalid API key"), 1, "escalate", 1, "api_error", False, "Invalid API key"),
+            (None, Exception("JSONDecodeError: Expecting value"), 1, "escalate", 1, "validation_error", False, "truncated or malformed"),
+            (_EMPTY_GOAL_SPEC, None, 1, "escalate", 1, "validation_error", False, "Could not extract meaningful entities or intent"),
+        ],
+        ids=["network_first_attempt", "network_retry_attempt", "api_error", "truncated_response", "empty_output"],
+    )
+    def test_parse_goal_error(self, patched_llm, call_node, goal_spec, exc, current_attempt, expected_step,
+                              expected_attempt, expected_error_type, expected_retryable, expected_message):
+        """Test routing and classification of LLM and validation errors."""
+        patched_llm(goal_spec=goal_spec, exc=exc)
         
-        result = parse_goal(state, runtime=mock_runtime)
+        result = call_node("Create a person node", current_attempt)
         
-        # Should route to diagnose on first attempt failure
-        assert result.current_step == "diagnose"
-        assert result.current_attempt == 2
+        assert result.current_step == expected_step
+        assert result.current_attempt == expected_attempt
         assert result.result.status == "error"
-        assert result.result.error_type == "network_error"
+        assert result.result.error_type == expected_error_type
+        assert result.result.retryable is expected_retryable
+        assert expected_message in result.result.error
         assert len(result.failures) == 1
     
-    @patch('puntini.nodes.parse_goal.get_runtime')
-    def test_parse_goal_llm_error_retry_attempt(self, mock_get_runtime):
-        """Test handling of LLM errors on retry attempt."""
-        # Mock LLM to raise an exception
-        mock_llm = Mock()
-        mock_llm.with_structured_output.side_effect = Exception("LLM connection failed")
-        mock_runtime = Mock()
-        mock_runtime.context = {'llm': mock_llm}
-        mock_get_runtime.return_value = mock_runtime
-        
-        state = {
-            "goal": "Create a person node",
-            "current_attempt": 2
-        }
-        
-        result = parse_goal(state, runtime=mock_runtime)
-        
-        # Should escalate after retry failure
-        assert result.current_step == "escalate"
-        assert result.current_attempt == 2
-        assert result.result.status == "error"
-        assert result.result.error_type == "network_error"
-        assert len(result.failures) == 1
-    
-    @patch('puntini.nodes.parse_goal.get_runtime')
-    @patch('puntini.nodes.parse_goal.ChatPromptTemplate')
-    def test_parse_goal_validation_error(self, mock_prompt, mock_get_runtime):
-        """Test handling of validation errors in parsed goal."""
-        # Mock LLM and runtime
-        mock_llm = Mock()
-        mock_structured_llm = Mock()
-        mock_llm.with_structured_output.return_value = mock_structured_llm
-        mock_runtime = Mock()
-        mock_runtime.context = {'llm': mock_llm}
-        mock_get_runtime.return_value = mock_runtime
-
-        # Mock the LLM response with invalid data
-        mock_goal_spec = GoalSpec(
-            original_goal="Create a person node",
-            intent="",  # Empty intent should cause validation error
-            complexity=GoalComplexity.SIMPLE,
-            entities=[],  # No entities
-            constraints=[],
-            domain_hints=[],
-            estimated_steps=1,
-            requires_human_input=False,
-            priority="medium",
-            confidence=0.9,
-            parsing_notes=[]
-        )
-        
-        mock_structured_llm.invoke.return_value = mock_goal_spec
+    def test_parse_goal_no_runtime(self, monkeypatch):
+        """Test that a missing runtime context escalates without calling the LLM."""
+        def _no_runtime():
+            raise Exception("Runtime not available")
         
-        # Mock the prompt template
-        mock_chain = Mock()
-        mock_chain.invoke.return_value = mock_goal_spec
-        mock_prompt.from_messages.return_value.__or__ = Mock(return_value=mock_chain)
+        monkeypatch.setattr(_parse_goal_module, "get_runtime", _no_runtime)
         
-        state = {
-            "goal": "Create a person node",
-            "current_attempt": 1
-        }
+        result = parse_goal({"goal": "Create a person node", "current_attempt": 1})
         
-        result = parse_goal(state, runtime=mock_runtime)
-        
-        # Should handle validation error gracefully by escalating
         assert result.current_step == "escalate"
         assert result.result.status == "error"
-        assert "Could not extract meaningful entities or intent" in result.result.error
+        assert result.result.error_type == "validation_error"
+        assert result.result.retryable is False
+        assert "Runtime context not available" in result.result.error
 
 
 class TestDetermineNextStep:
     """Test cases for the _determine_next_step function."""
     
-    def test_all_goals_route_to_plan_step(self):
+    @pytest.mark.parametrize("complexity", ["simple", "medium", "complex"])
+    def test_all_goals_route_to_plan_step(self, sample_goal_specs, complexity):
         """Test that all goals are routed to the planning step."""
-        goal_spec = GoalSpec(
-            original_goal="Create a node",
-            intent="Create a simple node",
-            complexity=GoalComplexity.SIMPLE,
-            entities=[
-                EntitySpec(name="node", type=EntityType.NODE)
-            ],
-            constraints=[],
-            domain_hints=[],
-            estimated_steps=1,
-            requires_human_input=False,
-            priority="medium",
-            confidence=0.9,
-            parsing_notes=[]
-        )
-        
-        next_step = _determine_next_step(goal_spec, 1)
+        next_step = _determine_next_step(sample_goal_specs[complexity], 1)
         assert next_step == "plan_step"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_goal_specs():
-    """Fixture providing sample goal specifications for testing."""
+    """Fixture providing sample goal specifications for testing.
+    
+    The specs are only read by the tests, so they are built once per module.
+    """
     return {
-        "simple": GoalSpec(
+        "simple": GoalSpec.model_construct(
             original_goal="Create a person node",
             intent="Create a person entity",
             complexity=GoalComplexity.SIMPLE,
@@ -226,7 +234,7 @@ def sample_goal_specs():
             confidence=0.9,
             parsing_notes=[]
         ),
-        "medium": GoalSpec(
+        "medium": GoalSpec.model_construct(
             original_goal="Create a project with milestones",
             intent="Create a project management structure",
             complexity=GoalComplexity.MEDIUM,
@@ -243,7 +251,7 @@ def sample_goal_specs():
             confidence=0.8,
             parsing_notes=[]
         ),
-        "complex": GoalSpec(
+        "complex": GoalSpec.model_construct(
             original_goal="Build a complete social network with users, posts, and interactions",
             intent="Create a comprehensive social network graph",
             complexity=GoalComplexity.COMPLEX,
@@ -4,6 +4,7 @@ This module implements the CypherQA tool that translates natural
 language questions into Cypher queries and executes them.
 """
 
+import time
 from typing import Any, Dict
 from pydantic import BaseModel, Field
 
@@ -43,7 +44,8 @@ def cypher_qa(question: str, graph_store: Any) -> Dict[str, Any]:
     """
     # TODO: Implement actual Cypher QA logic
     # This is a placeholder implementation
-    cypher_query = CypherQuery(
+    # The query is built here, so its validation is skipped
+    cypher_query = CypherQuery.model_construct(
         query="MATCH (n) RETURN n LIMIT 10",
         parameters={},
         explanation=f"Finding nodes related to: {question}"
@@ -51,12 +53,15 @@ def cypher_qa(question: str, graph_store: Any) -> Dict[str, Any]:
     
     try:
         # Execute the query
+        started = time.perf_counter()
         results = graph_store.run_cypher(cypher_query.query, cypher_query.parameters)
+        execution_time = time.perf_counter() - started
         
+        # Rows come from the database, so the result is validated
         cypher_result = CypherResult(
             query=cypher_query.query,
             results=results if isinstance(results, list) else [results],
-            execution_time=0.1,
+            execution_time=execution_time,
             success=True,
             error=None
         )